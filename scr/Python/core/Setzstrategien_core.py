@@ -7,6 +7,8 @@ from functools import lru_cache
 from fractions import Fraction
 from typing import Dict, List, Sequence, Tuple
 
+from core.profiling_core import active
+
 
 def wilson_interval(k: int, n: int, z: float = 1.96) -> Tuple[float, float]:
     """Wilson score interval for a binomial proportion."""
@@ -20,11 +22,18 @@ def wilson_interval(k: int, n: int, z: float = 1.96) -> Tuple[float, float]:
     return (center - halfwidth, center + halfwidth)
 
 
-def simulate_game(p: Sequence[float], A: Sequence[int], B: Sequence[int]) -> str:
+def simulate_game(
+    p: Sequence[float],
+    A: Sequence[int],
+    B: Sequence[int],
+    rng: random.Random | None = None,
+) -> str:
     """
     Simulates one game.
     Returns: 'A' if A finishes first, 'B' if B finishes first, 'U' if tie.
+    rng: optional random.Random instance (default: the global random module).
     """
+    rand = (rng or random).random
     m = len(p)
     chips_A = list(A)
     chips_B = list(B)
@@ -32,8 +41,15 @@ def simulate_game(p: Sequence[float], A: Sequence[int], B: Sequence[int]) -> str
     def fertig(chips: List[int]) -> bool:
         return all(c == 0 for c in chips)
 
+    throws = 0
+    wasted = 0  # throws on fields where neither player has chips left
+    # a wasted throw changes nothing and may skip the finish check - unless
+    # the game was over before the first throw (e.g. no chips at all)
+    finished_at_start = fertig(chips_A) or fertig(chips_B)
+
     while True:
-        r = random.random()
+        throws += 1
+        r = rand()
         s = 0.0
         feld = 0
         for j in range(m):
@@ -44,6 +60,9 @@ def simulate_game(p: Sequence[float], A: Sequence[int], B: Sequence[int]) -> str
 
         if chips_A[feld] > 0:
             chips_A[feld] -= 1
+        elif chips_B[feld] == 0 and not finished_at_start:
+            wasted += 1
+            continue
         if chips_B[feld] > 0:
             chips_B[feld] -= 1
 
@@ -51,11 +70,22 @@ def simulate_game(p: Sequence[float], A: Sequence[int], B: Sequence[int]) -> str
         b_done = fertig(chips_B)
 
         if a_done and b_done:
-            return "U"
-        if a_done:
-            return "A"
-        if b_done:
-            return "B"
+            result = "U"
+        elif a_done:
+            result = "A"
+        elif b_done:
+            result = "B"
+        else:
+            continue
+        break
+
+    report = active()
+    if report is not None:
+        report.count("simulate_game.games")
+        report.count("simulate_game.throws", throws)
+        report.count("simulate_game.wasted_throws", wasted)
+        report.peak("simulate_game.max_throws", throws)
+    return result
 
 
 def simulate_many(
@@ -64,13 +94,17 @@ def simulate_many(
     B: Sequence[int],
     n_runs: int = 10_000,
     z: float = 1.96,
+    seed: int | None = None,
 ) -> Dict[str, Dict[str, float]]:
     """
     Runs many simulations and returns estimates + Wilson CIs for outcomes A/B/U.
+    seed: if given, the games use a private random.Random(seed) (reproducible,
+    global random state untouched); otherwise the global random module.
     """
+    rng = random.Random(seed) if seed is not None else None
     counts = {"A": 0, "B": 0, "U": 0}
     for _ in range(n_runs):
-        counts[simulate_game(p, A, B)] += 1
+        counts[simulate_game(p, A, B, rng)] += 1
 
     results: Dict[str, Dict[str, float]] = {}
     for key in ("A", "B", "U"):
@@ -119,4 +153,13 @@ def exact_probabilities_fraction(
     PA = P_A(A, B)
     PB = P_A(B, A)
     PU = Fraction(1, 1) - PA - PB
+
+    report = active()
+    if report is not None:
+        info = P_A.cache_info()
+        report.count("exact_probabilities_fraction.states_visited", info.misses)
+        report.count("exact_probabilities_fraction.cache_hits", info.hits)
+        report.count("exact_probabilities_fraction.cache_misses", info.misses)
+        # lru_cache(None) never evicts: final size == peak size
+        report.peak("exact_probabilities_fraction.peak_cache_size", info.currsize)
     return PA, PB, PU
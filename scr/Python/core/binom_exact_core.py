@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from math import lgamma, log, log1p
+
+import numpy as np
+
+from core.binom_test_core import BinomCriticalRegion, Side, _pmf_recursion, _try_scipy_binom
+from core.rng_core import CounterSeed, ThreadedSeed, draw_binomial
+
+# Simulation in Blöcken: 10^8 Läufe brauchen so nur ein Histogramm der Länge n+1,
+# nicht 800 MB für die Einzelwerte.
+CHUNK = 1 << 22
+
+
+@dataclass(frozen=True)
+class ExactSpec:
+    n: int
+    p0: float
+    alpha: float
+    side: Side = "right"
+
+
+@dataclass(frozen=True)
+class BinomTables:
+    """
+    Exakte Verteilung von Bin(n,p0) auf 0..n (Arrays schreibgeschützt).
+
+    pmf[k] = P(X = k),  cdf[k] = P(X <= k),  sf[k] = P(X >= k)
+    """
+    pmf: np.ndarray
+    cdf: np.ndarray
+    sf: np.ndarray
+
+
+@dataclass(frozen=True)
+class ExactResult:
+    region: BinomCriticalRegion
+    a_ex: float             # exakt erreichtes Niveau P_H0(X in K) <= alpha
+    counts: np.ndarray      # Häufigkeiten der simulierten Werte 0..n
+    runs: int
+    a_hat: float            # simulierter Anteil in K
+
+
+def _pmf_lgamma(n: int, p: float) -> np.ndarray:
+    """PMF über log-Gamma; ohne SciPy, auch für große n ohne Unterlauf von q**n."""
+    k = np.arange(n + 1, dtype=float)
+    lg = np.array([lgamma(i + 1.0) for i in range(n + 1)])
+    log_pmf = lg[n] - lg - lg[::-1] + k * log(p) + (n - k) * log1p(-p)
+    return np.exp(log_pmf)
+
+
+@lru_cache(maxsize=64)
+def binom_tables(n: int, p0: float, prefer_scipy: bool = True) -> BinomTables:
+    """
+    PMF, CDF und SF für (n, p0), einmal berechnet und für alle drei
+    Testrichtungen (und jedes alpha) wiederverwendet.
+    """
+    k = np.arange(n + 1)
+    binom = _try_scipy_binom() if prefer_scipy else None
+    if p0 <= 0.0 or p0 >= 1.0:
+        pmf = np.zeros(n + 1, dtype=float)
+        pmf[0 if p0 <= 0.0 else n] = 1.0
+        cdf = np.cumsum(pmf)
+        sf = np.cumsum(pmf[::-1])[::-1]
+    elif binom is not None:
+        pmf = binom.pmf(k, n, p0)
+        cdf = binom.cdf(k, n, p0)
+        sf = binom.sf(k - 1, n, p0)  # P(X >= k) = sf(k-1), wie in critical_region
+    else:
+        # Rekursion wie critical_region, solange q**n nicht unterläuft
+        pmf = _pmf_recursion(n, p0) if n * log1p(-p0) > -700.0 else _pmf_lgamma(n, p0)
+        cdf = np.cumsum(pmf)
+        sf = np.cumsum(pmf[::-1])[::-1]  # von rechts summiert: keine Auslöschung in 1 - cdf
+    for a in (pmf, cdf, sf):
+        a.setflags(write=False)
+    return BinomTables(pmf=pmf, cdf=cdf, sf=sf)
+
+
+def exact_region(spec: ExactSpec, prefer_scipy: bool = True) -> tuple[BinomCriticalRegion, float]:
+    """
+    Kritischer Bereich wie critical_region, aber per Binärsuche in den
+    Tabellen; liefert zusätzlich das exakt erreichte Niveau a_ex.
+    """
+    t = binom_tables(spec.n, spec.p0, prefer_scipy)
+    a = spec.alpha / 2.0 if spec.side == "two" else spec.alpha
+
+    k_left = k_right = None
+    a_ex = 0.0
+    if spec.side in ("left", "two"):
+        # größtes k mit P(X <= k) <= a
+        i = int(np.searchsorted(t.cdf, a, side="right")) - 1
+        if i >= 0:
+            k_left = i
+            a_ex += float(t.cdf[i])
+    if spec.side in ("right", "two"):
+        # kleinstes k mit P(X >= k) <= a (sf fällt monoton)
+        i = int(np.searchsorted(-t.sf, -a, side="left"))
+        if i <= spec.n:
+            k_right = i
+            a_ex += float(t.sf[i])
+    return BinomCriticalRegion(k_left=k_left, k_right=k_right), a_ex
+
+
+def _chunk_seeds(seed, runs: int):
+    """Seed je Block, so dass die Blöcke zusammen einen Lauf ergeben."""
+    starts = range(0, runs, CHUNK)
+    if isinstance(seed, CounterSeed):
+        # zählerbasiert: Block ab i = Realisierungen i.. des Gesamtlaufs
+        return [(CounterSeed(seed.seed, seed.start + i), min(CHUNK, runs - i)) for i in starts]
+    if isinstance(seed, ThreadedSeed):
+        if runs <= CHUNK:
+            return [(seed, runs)]
+        # je Block ein eigener, aus seed abgeleiteter Seed
+        states = np.random.SeedSequence(seed.seed).generate_state(len(starts), dtype=np.uint64)
+        return [(ThreadedSeed(int(s), seed.threads), min(CHUNK, runs - i)) for s, i in zip(states, starts)]
+    rng = np.random.default_rng(seed)  # ein Strom über alle Blöcke
+    return [(rng, min(CHUNK, runs - i)) for i in starts]
+
+
+def simulate_counts(
+    n: int, p0: float, runs: int, seed: int | CounterSeed | ThreadedSeed | None = 42
+) -> np.ndarray:
+    """
+    Häufigkeiten der Werte 0..n in runs Realisierungen von Bin(n,p0).
+    Blockweise über draw_binomial gezogen und per np.bincount gezählt; für
+    int-, None- und CounterSeed-Seeds identisch mit
+    np.bincount(simulate_binom(n, p0, runs, seed), minlength=n+1),
+    für ThreadedSeed bis CHUNK Läufe (darüber reproduzierbar, aber anders
+    aufgeteilt).
+    """
+    counts = np.zeros(n + 1, dtype=np.int64)
+    for chunk_seed, size in _chunk_seeds(seed, runs):
+        counts += np.bincount(draw_binomial(n, p0, size, chunk_seed), minlength=n + 1)
+    return counts
+
+
+@lru_cache(maxsize=16)
+def _seeded_counts(n: int, p0: float, runs: int, seed: int | CounterSeed | ThreadedSeed) -> np.ndarray:
+    counts = simulate_counts(n, p0, runs, seed)
+    counts.setflags(write=False)
+    return counts
+
+
+def region_mask(n: int, region: BinomCriticalRegion, side: Side) -> np.ndarray:
+    """Boolesche Maske über 0..n: k liegt im kritischen Bereich."""
+    k = np.arange(n + 1)
+    mask = np.zeros(n + 1, dtype=bool)
+    if side in ("left", "two") and region.k_left is not None:
+        mask |= k <= region.k_left
+    if side in ("right", "two") and region.k_right is not None:
+        mask |= k >= region.k_right
+    return mask
+
+
+def exact_test(
+    spec: ExactSpec,
+    runs: int = 1000,
+    seed: int | CounterSeed | ThreadedSeed | None = 42,
+    prefer_scipy: bool = True,
+) -> ExactResult:
+    """
+    Exakter Bereich samt erreichtem Niveau und simuliertes alpha_hat in einem Schritt.
+    Die Häufigkeiten hängen nur von (n, p0, runs, seed) ab und werden für
+    feste Seeds zwischengespeichert: ändern sich nur alpha oder side, wird
+    nicht neu simuliert.
+    """
+    region, a_ex = exact_region(spec, prefer_scipy=prefer_scipy)
+    if isinstance(seed, (int, CounterSeed, ThreadedSeed)):
+        counts = _seeded_counts(spec.n, spec.p0, runs, seed)
+    else:
+        counts = simulate_counts(spec.n, spec.p0, runs, seed)
+    hits = int(counts[region_mask(spec.n, region, spec.side)].sum())
+    return ExactResult(region=region, a_ex=a_ex, counts=counts, runs=runs, a_hat=hits / runs if runs else 0.0)
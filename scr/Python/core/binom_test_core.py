@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from math import sqrt
 from typing import Literal
 
 import numpy as np
 
+from core.profiling_core import active
+from core.rng_core import CounterSeed, ThreadedSeed, draw_binomial
+
 Side = Literal["right", "left", "two"]
 
 
@@ -23,7 +27,9 @@ class BinomCriticalRegion:
     k_right: int | None
 
 
+@lru_cache(maxsize=None)
 def _try_scipy_binom():
+    """SciPy-binom oder None; wird nur beim ersten Aufruf importiert und geprüft."""
     try:
         from scipy.stats import binom  # type: ignore
         return binom
@@ -88,25 +94,40 @@ def critical_region(spec: BinomTestSpec, prefer_scipy: bool = True) -> BinomCrit
     - left:   K = {k <= k_left}
     - two:    K = {k <= k_left oder k >= k_right} mit alpha/2 in den Enden
     """
-    n, p0, alpha, side = spec.n, spec.p0, spec.alpha, spec.side
-
     use_scipy = prefer_scipy and (_try_scipy_binom() is not None)
+    region, evals = _search_critical_region(spec, use_scipy)
+
+    report = active()
+    if report is not None:
+        report.count("critical_region.calls")
+        report.count("critical_region.tail_evaluations", evals)
+        report.count(f"critical_region.backend.{'scipy' if use_scipy else 'exact'}")
+    return region
+
+
+def _search_critical_region(spec: BinomTestSpec, use_scipy: bool) -> tuple[BinomCriticalRegion, int]:
+    """Suche der Grenzen; liefert zusätzlich die Anzahl der Tail-Auswertungen."""
+    n, p0, alpha, side = spec.n, spec.p0, spec.alpha, spec.side
+    evals = 0
 
     if side == "right":
         for k in range(0, n + 1):
+            evals += 1
             sf = _binom_sf_scipy(k - 1, n, p0) if use_scipy else binom_sf_exact(k, n, p0)
             if sf <= alpha:
-                return BinomCriticalRegion(k_left=None, k_right=k)
-        return BinomCriticalRegion(None, None)
+                return BinomCriticalRegion(k_left=None, k_right=k), evals
+        return BinomCriticalRegion(None, None), evals
 
     if side == "left":
+        k_left = None
         for k in range(0, n + 1):
+            evals += 1
             cdf = _binom_cdf_scipy(k, n, p0) if use_scipy else binom_cdf_exact(k, n, p0)
             if cdf <= alpha:
                 k_left = k
             else:
                 break
-        return BinomCriticalRegion(k_left=k_left if "k_left" in locals() else None, k_right=None)
+        return BinomCriticalRegion(k_left=k_left, k_right=None), evals
 
     # two-sided
     a2 = alpha / 2.0
@@ -114,6 +135,7 @@ def critical_region(spec: BinomTestSpec, prefer_scipy: bool = True) -> BinomCrit
     # left cutoff: largest k with CDF <= a2
     k_left = None
     for k in range(0, n + 1):
+        evals += 1
         cdf = _binom_cdf_scipy(k, n, p0) if use_scipy else binom_cdf_exact(k, n, p0)
         if cdf <= a2:
             k_left = k
@@ -123,17 +145,25 @@ def critical_region(spec: BinomTestSpec, prefer_scipy: bool = True) -> BinomCrit
     # right cutoff: smallest k with SF <= a2
     k_right = None
     for k in range(0, n + 1):
+        evals += 1
         sf = _binom_sf_scipy(k - 1, n, p0) if use_scipy else binom_sf_exact(k, n, p0)
         if sf <= a2:
             k_right = k
             break
 
-    return BinomCriticalRegion(k_left=k_left, k_right=k_right)
+    return BinomCriticalRegion(k_left=k_left, k_right=k_right), evals
 
 
-def simulate_binom(n: int, p: float, runs: int, seed: int | None = 42) -> np.ndarray:
-    rng = np.random.default_rng(seed)
-    return rng.binomial(n, p, size=runs)
+def simulate_binom(
+    n: int, p: float, runs: int, seed: int | CounterSeed | ThreadedSeed | None = 42
+) -> np.ndarray:
+    """
+    runs Realisierungen von Bin(n,p).
+    Mit seed=CounterSeed(s, start=i) werden genau die Realisierungen
+    i..i+runs-1 des zählerbasierten Laufs mit Seed s erzeugt,
+    mit seed=ThreadedSeed(s, t) parallel auf t Threads.
+    """
+    return draw_binomial(n, p, runs, seed)
 
 
 def alpha_hat_from_region(X: np.ndarray, region: BinomCriticalRegion, side: Side) -> float:
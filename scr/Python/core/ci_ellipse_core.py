@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from math import sqrt
+
 import numpy as np
 from statistics import NormalDist
 
@@ -22,6 +25,45 @@ def band_h(p: np.ndarray, n: int, z: float) -> tuple[np.ndarray, np.ndarray]:
     return lower, upper
 
 
+def adaptive_p_grid(points: int = 1001) -> np.ndarray:
+    """
+    p-Gitter auf [0,1], verdichtet bei p = 0 und p = 1, wo die Bandkurven
+    (Wurzel aus p(1-p)) am steilsten sind: p = (1 - cos(pi*t)) / 2.
+    """
+    t = np.linspace(0.0, 1.0, points)
+    p = 0.5 * (1.0 - np.cos(np.pi * t))
+    p[0], p[-1] = 0.0, 1.0
+    return p
+
+
+@lru_cache(maxsize=128)
+def band_geometry(n: int, gamma: float, points: int = 1001) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Band (p, lower, upper) auf dem adaptiven Gitter, zwischengespeichert je (n, gamma).
+    Die Arrays sind schreibgeschützt, da sie geteilt werden.
+    """
+    p = adaptive_p_grid(points)
+    lower, upper = band_h(p, n, z_value(gamma))
+    for a in (p, lower, upper):
+        a.flags.writeable = False
+    return p, lower, upper
+
+
+def band_ci(h_obs: float, n: int, z: float) -> tuple[float, float]:
+    """
+    Schnitt der Horizontalen h = h_obs mit dem Band in geschlossener Form.
+
+    |h - p| <= z*sqrt(p(1-p)/n) ist eine quadratische Ungleichung in p;
+    ihre Lösungsmenge ist genau das Wilson-Intervall zu h.
+    """
+    if not 0.0 <= h_obs <= 1.0:
+        return float("nan"), float("nan")
+    denom = 1.0 + z * z / n
+    center = (h_obs + z * z / (2.0 * n)) / denom
+    half = z * sqrt(h_obs * (1.0 - h_obs) / n + z * z / (4.0 * n * n)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
 def invert_band_to_ci(h_obs: float, n: int, gamma: float, grid: int = 20001) -> tuple[float, float]:
     """
     Invertiert das Band h = p ± z*sqrt(p(1-p)/n) zu einem CI für p
@@ -54,3 +96,15 @@ def prognose_schnitte(p_left: float, p_right: float, k: int) -> np.ndarray:
     if p_right < p_left:
         p_left, p_right = p_right, p_left
     return np.linspace(p_left, p_right, k)
+
+
+def prognose_intervalle(
+    p_left: float, p_right: float, k: int, n: int, z: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    k Prognoseintervalle im CI in einem vektorisierten Schritt.
+    Returns (ps, h_lower, h_upper), je mit Länge k (bzw. 0).
+    """
+    ps = prognose_schnitte(p_left, p_right, k)
+    lower, upper = band_h(ps, n, z)
+    return ps, lower, upper
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+Params = Tuple[Tuple[str, Any], ...]
+
+
+def _freeze(params: Mapping[str, Any]) -> Params:
+    # Slider-Werte wie 0.6 + 0.01 sollen denselben Schlüssel ergeben wie 0.61
+    return tuple(sorted((k, round(v, 12) if isinstance(v, float) else v) for k, v in params.items()))
+
+
+@dataclass(frozen=True)
+class Step:
+    """
+    Nachbarschaft eines Parameters für die Vorausberechnung.
+
+    delta:  Schrittweite des Sliders (n: 1, p0: 0.01, ...)
+    radius: wie viele Schritte in jede Richtung vorausberechnet werden
+    lo, hi: zulässiger Bereich (Werte außerhalb werden nicht berechnet)
+    """
+    delta: float
+    radius: int = 1
+    lo: float | None = None
+    hi: float | None = None
+
+    def neighbours(self, value) -> List[Any]:
+        out = []
+        for i in range(1, self.radius + 1):
+            for sign in (1, -1):
+                v = value + sign * i * self.delta
+                if isinstance(value, int) and isinstance(self.delta, int):
+                    v = int(v)
+                if (self.lo is None or v >= self.lo) and (self.hi is None or v <= self.hi):
+                    out.append(v)
+        return out
+
+
+class Prefetcher:
+    """
+    Spekulative Vorausberechnung für Slider-Ansichten.
+
+    get(**params) liefert das Ergebnis von fn(**params) – aus dem Cache,
+    aus einer bereits laufenden Hintergrundberechnung oder neu berechnet.
+    Aufrufe mit seed=None (ungeseedeter Lauf) werden immer neu berechnet,
+    weder gecacht noch vorausberechnet.
+    Danach werden im Hintergrund (Thread-Pool) die Nachbarwerte angestoßen
+    (z. B. n ± 1, p0 ± 0.01), jeweils ein Parameter verändert. Noch nicht
+    gestartete Vorausberechnungen eines früheren Aufrufs werden verworfen,
+    sobald der Slider weiterbewegt wird.
+
+    Beispiel:
+        pf = Prefetcher(critical_region_for, steps={"n": Step(1), "p0": Step(0.01, lo=0, hi=1)})
+        region = pf.get(n=100, p0=0.6, alpha=0.05, side="two")
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        steps: Mapping[str, Step],
+        max_entries: int = 256,
+        workers: int = 2,
+    ):
+        self.fn = fn
+        self.steps = dict(steps)
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Params, Any]" = OrderedDict()
+        self._pending: Dict[Params, Future] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self.hits = 0
+        self.misses = 0
+
+    # --------------------------------------------------------
+    def _store(self, key: Params, value: Any) -> None:
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def _compute(self, key: Params) -> Any:
+        try:
+            value = self.fn(**dict(key))
+            self._store(key, value)
+        finally:
+            # auch bei Fehlern: sonst bliebe der fertige Auftrag für immer hängen
+            with self._lock:
+                self._pending.pop(key, None)
+        return value
+
+    def _neighbours(self, params: Mapping[str, Any]) -> Iterable[Params]:
+        for name, step in self.steps.items():
+            if name not in params:
+                continue
+            for v in step.neighbours(params[name]):
+                yield _freeze({**params, name: v})
+
+    def _prefetch(self, params: Mapping[str, Any]) -> None:
+        wanted = set(self._neighbours(params))
+        with self._lock:
+            # fertige (auch fehlgeschlagene) und veraltete, noch nicht
+            # gestartete Aufträge entfernen
+            for key, fut in list(self._pending.items()):
+                if fut.done() or (key not in wanted and fut.cancel()):
+                    del self._pending[key]
+            for key in wanted:
+                if key in self._cache or key in self._pending:
+                    continue
+                self._pending[key] = self._pool.submit(self._compute, key)
+
+    # --------------------------------------------------------
+    def get(self, **params) -> Any:
+        if "seed" in params and params["seed"] is None:
+            # ungeseedeter Lauf: jedes Mal neu ziehen, nichts cachen/vorausberechnen
+            self.misses += 1
+            return self.fn(**params)
+
+        key = _freeze(params)
+        with self._lock:
+            hit = key in self._cache
+            if hit:
+                self._cache.move_to_end(key)
+                value = self._cache[key]
+            fut = self._pending.get(key)
+            if fut is not None and fut.done():
+                del self._pending[key]  # fertig oder fehlgeschlagen: nicht länger vormerken
+
+        if not hit and fut is not None:
+            try:
+                value = fut.result()  # läuft schon: abwarten statt neu rechnen
+                hit = True
+            except CancelledError:
+                pass
+            except Exception:
+                pass  # im Hintergrund fehlgeschlagen: unten selbst rechnen (und Fehler melden)
+
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+            value = self._compute(key)
+
+        self._prefetch(params)
+        return value
+
+    def wait(self) -> None:
+        """Wartet auf alle laufenden Vorausberechnungen (z. B. für Tests/Benchmarks)."""
+        with self._lock:
+            futures = list(self._pending.values())
+        for fut in futures:
+            if not fut.cancelled():
+                fut.exception()
+
+    def clear(self) -> None:
+        with self._lock:
+            for fut in self._pending.values():
+                fut.cancel()
+            self._pending.clear()
+            self._cache.clear()
+
+    def close(self) -> None:
+        self.clear()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ============================================================
+# Fertige Vorausberechner für die Notebook-Ansichten
+# ============================================================
+
+def _binom_test_data(n: int, p0: float, alpha: float, side: str, runs: int, seed: int | None, prefer_scipy: bool = True):
+    import numpy as np
+
+    from core.binom_test_core import BinomTestSpec, alpha_hat_from_region, critical_region, simulate_binom
+
+    spec = BinomTestSpec(n=n, p0=p0, alpha=alpha, side=side)  # type: ignore[arg-type]
+    region = critical_region(spec, prefer_scipy=prefer_scipy)
+    X = simulate_binom(n, p0, runs=runs, seed=seed)
+    # nur das Histogramm (n+1 Werte) cachen, nicht die runs Einzelwerte
+    return region, np.bincount(X, minlength=n + 1), alpha_hat_from_region(X, region, side)  # type: ignore[arg-type]
+
+
+def _wilson_data(n: int, p_true: float, gamma: float, m: int, seed):
+    from core.wilson_core import simulate_wilson_intervals
+
+    return simulate_wilson_intervals(n=n, p_true=p_true, gamma=gamma, m=m, seed=seed)
+
+
+def _ellipse_data(n: int, gamma: float):
+    from core.ci_ellipse_core import band_geometry
+
+    return band_geometry(n, gamma)
+
+
+def binom_test_prefetcher(**kwargs) -> Prefetcher:
+    """(region, counts, alpha_hat) für den Binomialtest (counts[k] = Anzahl X=k); Nachbarn in n, p0, alpha."""
+    return Prefetcher(
+        _binom_test_data,
+        steps={
+            "n": Step(1, lo=1),
+            "p0": Step(0.01, lo=0.0, hi=1.0),
+            "alpha": Step(0.01, lo=0.01, hi=0.5),
+        },
+        **kwargs,
+    )
+
+
+def wilson_prefetcher(**kwargs) -> Prefetcher:
+    """(intervals, cover, rate) der Wilson-Simulation; Nachbarn in n, p_true, gamma."""
+    return Prefetcher(
+        _wilson_data,
+        steps={
+            "n": Step(1, lo=1),
+            "p_true": Step(0.01, lo=0.0, hi=1.0),
+            "gamma": Step(0.01, lo=0.5, hi=0.99),
+        },
+        **kwargs,
+    )
+
+
+def ellipse_prefetcher(**kwargs) -> Prefetcher:
+    """Band (p, lower, upper) der Konfidenzellipse; Nachbarn in n und gamma."""
+    return Prefetcher(
+        _ellipse_data,
+        steps={"n": Step(1, lo=1), "gamma": Step(0.01, lo=0.5, hi=0.99)},
+        **kwargs,
+    )
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator
+
+
+@dataclass
+class ProfileReport:
+    """
+    Zähler und Zeiten einer Messung (siehe profiling()).
+
+    counters: aufsummierte Zählwerte, z. B. "simulate_game.throws"
+    peaks:    Maxima, z. B. "exact_probabilities_fraction.peak_cache_size"
+    timers:   aufsummierte Zeiten in Sekunden, z. B. "plot_ci_ellipse.draw"
+    """
+    counters: Dict[str, int] = field(default_factory=dict)
+    peaks: Dict[str, int] = field(default_factory=dict)
+    timers: Dict[str, float] = field(default_factory=dict)
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def peak(self, name: str, value: int) -> None:
+        if value > self.peaks.get(name, value - 1):
+            self.peaks[name] = value
+
+    def time(self, name: str, seconds: float) -> None:
+        self.timers[name] = self.timers.get(name, 0.0) + seconds
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        derived: Dict[str, float] = {}
+        games = self.counters.get("simulate_game.games", 0)
+        if games:
+            derived["simulate_game.throws_per_game"] = self.counters.get("simulate_game.throws", 0) / games
+            derived["simulate_game.wasted_share"] = (
+                self.counters.get("simulate_game.wasted_throws", 0)
+                / max(self.counters.get("simulate_game.throws", 0), 1)
+            )
+        return {
+            "counters": dict(self.counters),
+            "peaks": dict(self.peaks),
+            "timers": dict(self.timers),
+            "derived": derived,
+        }
+
+    def summary(self) -> str:
+        lines = []
+        for section, values in self.as_dict().items():
+            if not values:
+                continue
+            lines.append(f"[{section}]")
+            for name in sorted(values):
+                v = values[name]
+                if section == "timers":
+                    lines.append(f"  {name:50s} {v * 1e3:12.3f} ms")
+                elif isinstance(v, float):
+                    lines.append(f"  {name:50s} {v:12.4f}")
+                else:
+                    lines.append(f"  {name:50s} {v:12d}")
+        return "\n".join(lines)
+
+
+_ACTIVE: ProfileReport | None = None
+
+
+def active() -> ProfileReport | None:
+    """Der laufende Bericht oder None (dann wird nichts gezählt)."""
+    return _ACTIVE
+
+
+@contextmanager
+def profiling() -> Iterator[ProfileReport]:
+    """
+    Schaltet die Zähler der Simulations- und Exaktlöser ein.
+
+        with profiling() as report:
+            simulate_many(p, A, B, n_runs=10_000)
+        print(report.summary())
+
+    Außerhalb des Blocks fragen die Funktionen nur einmal pro Aufruf
+    active() ab und zählen nichts.
+    """
+    global _ACTIVE
+    previous = _ACTIVE
+    report = ProfileReport()
+    _ACTIVE = report
+    try:
+        yield report
+    finally:
+        _ACTIVE = previous
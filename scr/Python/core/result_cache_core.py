@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Sequence, Tuple
+
+# Verzeichnis per Umgebungsvariable umlenkbar, z. B. auf ein geteiltes Laufwerk
+CACHE_ENV = "KIT_CACHE_DIR"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Verdrängung räumt bis auf diesen Anteil von max_bytes auf, damit nicht jeder
+# weitere Schreibzugriff gleich wieder das ganze Verzeichnis durchsucht
+EVICT_TO = 0.9
+# spätestens nach so vielen Schreibzugriffen wird die Größe neu gezählt
+# (andere Prozesse schreiben ins selbe Verzeichnis)
+RESCAN_EVERY = 256
+
+
+def _default_dir() -> Path:
+    env = os.environ.get(CACHE_ENV)
+    if env:
+        return Path(env)
+    return Path.home() / ".cache" / "kit-ci"
+
+
+def _fraction_pair(x) -> list[int]:
+    """Exakter Bruch als [Zähler, Nenner] (auch für floats, binär exakt)."""
+    f = Fraction(x)
+    return [f.numerator, f.denominator]
+
+
+def code_version(*modules: str) -> str:
+    """Hash über den Quelltext der angegebenen Module (z. B. "core.Setzstrategien_core")."""
+    import importlib.util
+
+    h = hashlib.sha256()
+    for mod in modules:
+        spec = importlib.util.find_spec(mod)
+        if spec is None or spec.origin is None:
+            raise ImportError(f"Modul {mod} nicht gefunden.")
+        h.update(Path(spec.origin).read_bytes())
+    return h.hexdigest()[:16]
+
+
+class ResultCache:
+    """
+    Ergebnis-Cache auf der Festplatte.
+
+    - Schlüssel: SHA-256 über eine kanonische JSON-Darstellung der Eingaben
+    - Werte: kompaktes JSON, eine Datei pro Eintrag
+    - Größe begrenzt; verdrängt werden die am längsten nicht benutzten
+      Einträge (Zugriff aktualisiert die mtime). Die Gesamtgröße wird pro
+      Instanz mitgeführt; das Verzeichnis wird nur durchsucht, wenn sie
+      max_bytes überschreitet oder nach RESCAN_EVERY Schreibzugriffen.
+    - mehrere Prozesse/Rechner: Schreiben atomar (temporäre Datei +
+      os.replace), Verdrängung unter Dateisperre, fehlende Dateien sind kein
+      Fehler
+    """
+
+    def __init__(self, directory: Path | str | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory) if directory is not None else _default_dir()
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._approx_bytes: int | None = None  # None: noch nicht gezählt
+        self._puts_since_scan = 0
+
+    # --------------------------------------------------------
+    @staticmethod
+    def key(namespace: str, payload: Dict[str, Any]) -> str:
+        canonical = json.dumps([namespace, payload], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        path = self._path(key)
+        try:
+            data = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)  # als kürzlich benutzt markieren
+        except OSError:  # z. B. schreibgeschützter geteilter Cache: Lesen klappt trotzdem
+            pass
+        try:
+            return json.loads(data)
+        except json.JSONDecodeError:
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f, separators=(",", ":"))
+                written = f.tell()
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+
+        self._puts_since_scan += 1
+        if self._approx_bytes is None or self._puts_since_scan >= RESCAN_EVERY:
+            self.evict()
+        else:
+            self._approx_bytes += written
+            if self._approx_bytes > self.max_bytes:
+                self.evict()
+
+    def get_or_compute(self, namespace: str, payload: Dict[str, Any], compute: Callable[[], Any]) -> Any:
+        """
+        Wert aus dem Cache oder compute() (JSON-serialisierbar) berechnen und
+        ablegen; lässt sich nicht schreiben, wird der Wert nur zurückgegeben.
+        """
+        key = self.key(namespace, payload)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            try:
+                self.put(key, value)
+            except OSError:  # z. B. schreibgeschützter geteilter Cache: Ergebnis trotzdem liefern
+                pass
+        return value
+
+    # --------------------------------------------------------
+    def _entries(self) -> list[Tuple[float, int, Path]]:
+        out = []
+        for path in self.directory.glob("*/*.json"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            out.append((st.st_mtime, st.st_size, path))
+        return out
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        try:
+            import fcntl
+        except ImportError:  # Windows: ohne Sperre, Löschen ist trotzdem tolerant
+            yield
+            return
+        with open(self.directory / ".lock", "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def evict(self) -> None:
+        """
+        Zählt die Größe neu; liegt sie über max_bytes, werden die ältesten
+        Einträge gelöscht, bis EVICT_TO * max_bytes erreicht ist.
+        """
+        self._puts_since_scan = 0
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            with self._lock():
+                entries = sorted(self._entries())
+                total = sum(size for _, size, _ in entries)
+                target = int(EVICT_TO * self.max_bytes)
+                for _, size, path in entries:
+                    if total <= target:
+                        break
+                    try:
+                        path.unlink()
+                    except FileNotFoundError:
+                        pass
+                    total -= size
+        self._approx_bytes = total
+
+    def clear(self) -> None:
+        with self._lock():
+            for _, _, path in self._entries():
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+        self._approx_bytes = 0
+
+
+_DEFAULT: ResultCache | None = None
+
+
+def default_cache() -> ResultCache:
+    """Gemeinsamer Cache im Standardverzeichnis (bzw. $KIT_CACHE_DIR)."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = ResultCache()
+    return _DEFAULT
+
+
+# ============================================================
+# Zwischengespeicherte Varianten der teuren Berechnungen
+# ============================================================
+
+def exact_probabilities_cached(
+    p: Sequence[Fraction],
+    A: Sequence[int],
+    B: Sequence[int],
+    cache: ResultCache | None = None,
+) -> Tuple[Fraction, Fraction, Fraction]:
+    """
+    Wie exact_probabilities_fraction, Ergebnis wird auf der Festplatte abgelegt.
+    Schlüssel: p als exakte Brüche, A, B und Code-Stand; rechnerunabhängig.
+    """
+    from core.Setzstrategien_core import exact_probabilities_fraction
+
+    cache = cache or default_cache()
+    payload = {
+        "p": [_fraction_pair(pi) for pi in p],
+        "A": list(A),
+        "B": list(B),
+        "code": code_version("core.Setzstrategien_core"),
+    }
+
+    def compute():
+        return [_fraction_pair(v) for v in exact_probabilities_fraction(p, A, B)]
+
+    PA, PB, PU = (Fraction(num, den) for num, den in cache.get_or_compute("exact_probabilities", payload, compute))
+    return PA, PB, PU
+
+
+def simulate_many_cached(
+    p: Sequence[float],
+    A: Sequence[int],
+    B: Sequence[int],
+    n_runs: int = 10_000,
+    z: float = 1.96,
+    seed: int = 0,
+    cache: ResultCache | None = None,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Wie simulate_many mit festem Seed, Ergebnis wird auf der Festplatte abgelegt.
+    Ohne Seed wäre das Ergebnis zufällig und nicht wiederverwendbar.
+    """
+    from core.Setzstrategien_core import simulate_many
+
+    cache = cache or default_cache()
+    payload = {
+        "p": [_fraction_pair(pi) for pi in p],
+        "A": list(A),
+        "B": list(B),
+        "n_runs": n_runs,
+        "z": _fraction_pair(z),
+        "seed": seed,
+        "code": code_version("core.Setzstrategien_core"),
+    }
+    return cache.get_or_compute(
+        "simulate_many", payload,
+        lambda: simulate_many(p, A, B, n_runs=n_runs, z=z, seed=seed),
+    )
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CounterSeed:
+    """
+    Zählerbasierter Seed: Realisierung i hängt nur von (seed, i) ab.
+
+    Statt eines fortlaufenden Zufallsstroms erhält jede Realisierung einen
+    eigenen Philox-Zählerblock. Damit lässt sich z. B. "Intervall #73" oder
+    ein Ausschnitt i..j einzeln nachrechnen – mit denselben Werten wie im
+    vollständigen Lauf. Kann überall dort übergeben werden, wo ``seed``
+    erwartet wird.
+
+    start: Index der ersten erzeugten Realisierung (0-basiert).
+    """
+    seed: int
+    start: int = 0
+
+
+@dataclass(frozen=True)
+class ThreadedSeed:
+    """
+    Seed für parallele Zufallszahlerzeugung in Threads.
+
+    Aus ``seed`` werden per SeedSequence.spawn ``threads`` Kind-Generatoren
+    abgeleitet; jeder füllt einen eigenen, disjunkten Abschnitt desselben
+    Ausgabe-Arrays. NumPy gibt dabei den GIL frei, daher genügen Threads
+    (kein Pickling wie bei Prozessen).
+
+    Das Ergebnis ist für festes (seed, threads) reproduzierbar, hängt aber
+    von der Thread-Zahl ab. threads=None bedeutet os.cpu_count().
+    """
+    seed: int | None
+    threads: int | None = None
+
+    def n_threads(self) -> int:
+        return max(1, self.threads if self.threads is not None else (os.cpu_count() or 1))
+
+
+def _philox_key(seed: int) -> np.ndarray:
+    """128-Bit-Philox-Schlüssel aus einem ganzzahligen Seed."""
+    return np.random.SeedSequence(seed).generate_state(2, dtype=np.uint64)
+
+
+def counter_uniforms(seed: int, start: int, stop: int) -> np.ndarray:
+    """
+    Gleichverteilte Zahlen u_i in [0,1) für die Realisierungen start..stop-1.
+
+    Philox liefert pro Zählerschritt 4 Wörter: u_i ist Wort i % 4 des
+    Blocks mit Zähler i // 4 und damit unabhängig davon, welche anderen
+    Realisierungen berechnet werden.
+    """
+    if stop < start:
+        raise ValueError("stop muss >= start sein.")
+    if stop == start:
+        return np.empty(0, dtype=float)
+    first, last = start // 4, (stop - 1) // 4
+    bitgen = np.random.Philox(key=_philox_key(seed))
+    if first:
+        bitgen.advance(first)
+    raw = bitgen.random_raw(4 * (last - first + 1))[start - 4 * first: stop - 4 * first]
+    return (raw >> np.uint64(11)) * (1.0 / 9007199254740992.0)
+
+
+def binom_cdf_table(n: int, p: float) -> np.ndarray:
+    """
+    Verteilungsfunktion von Bin(n,p) auf 0..n (Log-Rekursion, ohne SciPy).
+    Auch für große n stabil, da q**n nicht direkt gebildet wird.
+    """
+    if p <= 0.0:
+        return np.ones(n + 1, dtype=float)
+    if p >= 1.0:
+        cdf = np.zeros(n + 1, dtype=float)
+        cdf[n] = 1.0
+        return cdf
+
+    k = np.arange(1, n + 1, dtype=float)
+    log_pmf = np.empty(n + 1, dtype=float)
+    log_pmf[0] = n * np.log1p(-p)
+    log_pmf[1:] = log_pmf[0] + np.cumsum(np.log((n - k + 1) / k) + np.log(p / (1.0 - p)))
+    pmf = np.exp(log_pmf - log_pmf.max())
+    cdf = np.cumsum(pmf)
+    return cdf / cdf[-1]
+
+
+def binomial_counter(n: int, p: float, seed: int, start: int, stop: int) -> np.ndarray:
+    """
+    Bin(n,p)-Realisierungen start..stop-1 im Zähler-Layout (Inversionsmethode).
+    """
+    u = counter_uniforms(seed, start, stop)
+    X = np.searchsorted(binom_cdf_table(n, p), u, side="right")
+    return np.minimum(X, n).astype(np.int64)
+
+
+def binomial_threaded(n: int, p: float, size: int, seed: ThreadedSeed) -> np.ndarray:
+    """
+    Bin(n,p)-Realisierungen, abschnittsweise in einem Thread-Pool erzeugt.
+    """
+    threads = min(seed.n_threads(), max(1, size))
+    children = np.random.SeedSequence(seed.seed).spawn(threads)
+    bounds = np.linspace(0, size, threads + 1).astype(np.int64)
+    out = np.empty(size, dtype=np.int64)
+
+    def fill(i: int) -> None:
+        a, b = bounds[i], bounds[i + 1]
+        out[a:b] = np.random.default_rng(children[i]).binomial(n, p, size=b - a)
+
+    if threads == 1:
+        fill(0)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(fill, range(threads)))
+    return out
+
+
+def draw_binomial(n: int, p: float, size: int, seed) -> np.ndarray:
+    """
+    Gemeinsamer Einstieg für alle Binomial-Simulationen.
+
+    seed:
+      - int | None:   klassischer Strom via np.random.default_rng(seed)
+      - Generator:    laufender Strom (z. B. für blockweises Ziehen)
+      - CounterSeed:  zählerbasiertes Layout (wahlfreier Zugriff)
+      - ThreadedSeed: parallele Erzeugung in Threads
+    """
+    if isinstance(seed, CounterSeed):
+        return binomial_counter(n, p, seed.seed, seed.start, seed.start + size)
+    if isinstance(seed, ThreadedSeed):
+        return binomial_threaded(n, p, size, seed)
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    return rng.binomial(n, p, size=size)
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from math import sqrt
 from statistics import NormalDist
+from typing import Callable, Literal
 
 import numpy as np
 
+from core.rng_core import CounterSeed, ThreadedSeed, draw_binomial
+
 
 def z_value(gamma: float) -> float:
     """Zweiseitiger z-Wert der Standardnormalverteilung."""
@@ -21,33 +25,211 @@ def wilson_ci(k: int, n: int, z: float) -> tuple[float, float]:
     return center - half, center + half
 
 
+def wilson_ci_array(k: np.ndarray, n: int, z: float) -> tuple[np.ndarray, np.ndarray]:
+    """Wilson-Intervalle für viele Trefferzahlen k auf einmal (vektorisiert)."""
+    h = np.asarray(k) / n
+    denom = 1.0 + (z**2) / n
+    center = (h + (z**2) / (2.0 * n)) / denom
+    half = z * np.sqrt((h * (1.0 - h) / n) + (z**2) / (4.0 * n**2)) / denom
+    return center - half, center + half
+
+
 def simulate_wilson_intervals(
     n: int,
     p_true: float,
     gamma: float,
     m: int,
-    seed: int | None = 1,
+    seed: int | CounterSeed | ThreadedSeed | None = 1,
 ):
     """
     Simuliert m Wilson-Intervalle im Binomialmodell und prüft Überdeckung.
 
+    Mit seed=CounterSeed(s, start=i) entstehen die Intervalle i..i+m-1
+    des zählerbasierten Laufs mit Seed s – einzeln, in Teilstücken oder
+    parallel berechnet immer mit denselben Werten. Mit seed=ThreadedSeed(s, t)
+    werden die Ziehungen auf t Threads verteilt.
+
     Returns:
       intervals: np.ndarray (m,2)
       cover:     np.ndarray (m,) bool
       rate:      float
     """
     z = z_value(gamma)
-    rng = np.random.default_rng(seed)
-    X = rng.binomial(n, p_true, size=m)
+    X = draw_binomial(n, p_true, m, seed)
 
     intervals = np.empty((m, 2), dtype=float)
-    cover = np.empty(m, dtype=bool)
-
-    for i, k in enumerate(X):
-        L, R = wilson_ci(int(k), n, z)
-        intervals[i, 0] = L
-        intervals[i, 1] = R
-        cover[i] = (L <= p_true <= R)
+    intervals[:, 0], intervals[:, 1] = wilson_ci_array(X, n, z)
+    cover = (intervals[:, 0] <= p_true) & (p_true <= intervals[:, 1])
 
     rate = float(cover.mean())
     return intervals, cover, rate
+
+
+# ------------------------------------------------------------
+# Planung des Stichprobenumfangs
+# ------------------------------------------------------------
+
+@dataclass(frozen=True)
+class WilsonPlan:
+    """
+    Ergebnis von plan_wilson_n.
+
+    n:       kleinstes n, das das Ziel erfüllt (None, falls n_max nicht reicht)
+    value:   erreichte Breite bzw. Überdeckung bei n
+    curve_n: alle ausgewerteten n (aufsteigend)
+    curve:   zugehörige Breite bzw. Überdeckung
+    """
+    n: int | None
+    value: float
+    curve_n: np.ndarray
+    curve: np.ndarray
+
+
+def wilson_width(n, p, z: float) -> np.ndarray:
+    """
+    Breite des Wilson-Intervalls bei h = p (geplante Breite).
+    n und p werden gegeneinander gebroadcastet.
+    """
+    n = np.asarray(n, dtype=float)
+    p = np.asarray(p, dtype=float)
+    return 2.0 * z * np.sqrt(p * (1.0 - p) / n + z**2 / (4.0 * n**2)) / (1.0 + z**2 / n)
+
+
+def wilson_coverage(n, p, z: float) -> np.ndarray:
+    """
+    Exakte Überdeckungswahrscheinlichkeit des Wilson-Intervalls.
+
+    p liegt genau dann im Intervall zu k, wenn |k - np| <= z*sqrt(np(1-p)).
+    Die Überdeckung ist daher eine Differenz zweier Binomial-Verteilungsfunktionen.
+    """
+    from core.binom_test_core import _try_scipy_binom
+
+    binom = _try_scipy_binom()
+    if binom is None:
+        raise ImportError("scipy ist nicht verfügbar.")
+    n = np.asarray(n, dtype=float)
+    p = np.asarray(p, dtype=float)
+    mu = n * p
+    r = z * np.sqrt(n * p * (1.0 - p))
+    eps = 1e-9
+    k_lo = np.ceil(mu - r - eps)
+    k_hi = np.floor(mu + r + eps)
+    return binom.cdf(k_hi, n, p) - binom.cdf(k_lo - 1, n, p)
+
+
+def _p_grid(p_range: tuple[float, float], grid: int, worst_case: bool) -> np.ndarray:
+    lo, hi = p_range
+    if not 0.0 <= lo <= hi <= 1.0:
+        raise ValueError("p_range muss 0 <= p_lo <= p_hi <= 1 erfüllen.")
+    ps = np.linspace(lo, hi, grid)
+    if worst_case and lo <= 0.5 <= hi:
+        # bei p = 0.5 ist die Breite maximal
+        ps = np.union1d(ps, [0.5])
+    return ps
+
+
+def plan_wilson_n(
+    target: float,
+    gamma: float = 0.95,
+    p_range: tuple[float, float] = (0.0, 1.0),
+    prior: Callable[[np.ndarray], np.ndarray] | None = None,
+    criterion: Literal["width", "coverage"] = "width",
+    n_max: int | None = None,
+    grid: int = 201,
+    batch: int = 64,
+) -> WilsonPlan:
+    """
+    Kleinstes n, für das das Wilson-Intervall ein Ziel erfüllt.
+
+    criterion="width":    Breite <= target
+    criterion="coverage": Überdeckung >= target
+
+    Ohne prior gilt das Ziel im ungünstigsten Fall über p in p_range,
+    mit prior (Dichte auf p, z. B. lambda p: p*(1-p)) für den Erwartungswert.
+
+    Die Breite fällt monoton in n; gesucht wird per Bisektion, wobei in
+    jeder Runde `batch` Kandidaten auf einmal (vektorisiert) ausgewertet
+    werden. Die Überdeckung schwankt in n, dort wird aufsteigend in Blöcken
+    gesucht, beginnend mit `batch` n und dann jeweils doppelt so vielen
+    (Standard n_max = 10**4, sonst 10**7).
+
+    Achtung: Die Überdeckung des Wilson-Intervalls schwankt um gamma und
+    liegt für einzelne p auch bei großem n darunter. Ohne prior (ungünstigster
+    Fall) wird target >= gamma daher meist für kein n erreicht; die Suche
+    läuft dann bis n_max und liefert n=None. Sinnvoll sind dort Ziele etwas
+    unter gamma oder ein prior (mittlere Überdeckung).
+    """
+    z = z_value(gamma)
+    ps = _p_grid(p_range, grid, worst_case=prior is None)
+    if prior is not None:
+        w = np.asarray(prior(ps), dtype=float)
+        if w.sum() <= 0:
+            raise ValueError("prior muss auf p_range positives Gewicht haben.")
+        w = w / w.sum()
+
+    if criterion == "width":
+        n_max = 10**7 if n_max is None else n_max
+
+        def evaluate(ns: np.ndarray) -> np.ndarray:
+            W = wilson_width(ns[:, None], ps[None, :], z)
+            return W @ w if prior is not None else W.max(axis=1)
+
+        def ok(vals: np.ndarray) -> np.ndarray:
+            return vals <= target
+
+    elif criterion == "coverage":
+        n_max = 10**4 if n_max is None else n_max
+
+        def evaluate(ns: np.ndarray) -> np.ndarray:
+            C = wilson_coverage(ns[:, None], ps[None, :], z)
+            return C @ w if prior is not None else C.min(axis=1)
+
+        def ok(vals: np.ndarray) -> np.ndarray:
+            return vals >= target
+
+    else:
+        raise ValueError(f"Unbekanntes Kriterium: {criterion!r}")
+
+    seen_n: list[np.ndarray] = []
+    seen_v: list[np.ndarray] = []
+
+    def run(ns: np.ndarray) -> np.ndarray:
+        vals = evaluate(ns)
+        seen_n.append(ns)
+        seen_v.append(vals)
+        return vals
+
+    def result(n: int | None) -> WilsonPlan:
+        ns = np.concatenate(seen_n)
+        vs = np.concatenate(seen_v)
+        ns, idx = np.unique(ns, return_index=True)
+        vs = vs[idx]
+        value = float(vs[ns == n][0]) if n is not None else float("nan")
+        return WilsonPlan(n=n, value=value, curve_n=ns, curve=vs)
+
+    if criterion == "width":
+        # Invariante: Ziel bei hi erfüllt, bei lo nicht
+        lo, hi = 0, int(n_max)
+        if not ok(run(np.array([hi])))[0]:
+            return result(None)
+        while hi - lo > 1:
+            ns = np.unique(np.geomspace(lo + 1, hi, min(batch, hi - lo)).astype(np.int64))
+            hit = ok(run(ns))
+            first = int(np.argmax(hit)) if hit.any() else len(ns)
+            if first < len(ns):
+                hi = int(ns[first])
+            if first > 0:
+                lo = int(ns[first - 1])
+        return result(hi)
+
+    # Blöcke wachsen geometrisch ab batch: kleine n sind schnell geprüft,
+    # große Suchbereiche brauchen trotzdem nur wenige Runden
+    start, block = 1, max(batch, 1)
+    while start <= int(n_max):
+        ns = np.arange(start, min(start + block, int(n_max) + 1))
+        hit = ok(run(ns))
+        if hit.any():
+            return result(int(ns[np.argmax(hit)]))
+        start += block
+        block *= 2
+    return result(None)
@@ -3,8 +3,6 @@ from __future__ import annotations
 
 from typing import Dict, List, Sequence, Optional
 
-import matplotlib.pyplot as plt
-
 
 def plot_sim_vs_exact(
     sim_by_runs: Dict[int, Dict[str, Dict[str, float]]],
@@ -12,11 +10,15 @@ def plot_sim_vs_exact(
     labels: Sequence[str],
     save_path: Optional[str] = None,
     suptitle: str = "Simulation vs. exakte Werte für verschiedene Stichprobenumfänge",
+    show: bool = True,
 ):
     """
     sim_by_runs: {n_runs: {"A": {"p_hat":..., "CI_low":..., "CI_high":...}, "B":..., "U":...}}
     exact_floats: [P(A), P(B), P(U)]
+    show: False for headless use (the figure is closed after saving)
     """
+    import matplotlib.pyplot as plt
+
     n_runs_list = sorted(sim_by_runs.keys())
 
     fig, axes = plt.subplots(1, len(n_runs_list), figsize=(5 * len(n_runs_list), 5), sharey=True)
@@ -62,4 +64,7 @@ def plot_sim_vs_exact(
     if save_path:
         plt.savefig(save_path)
 
-    plt.show()
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
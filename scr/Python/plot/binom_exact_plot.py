@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.binom_exact_core import ExactSpec, binom_tables, exact_test, region_mask
+from core.binom_test_core import window_mu_sigma
+from core.rng_core import CounterSeed, ThreadedSeed
+from plot.binom_test_plot import BinomBarsView
+
+
+# above this many bars: no bar edges, exact PMF as a line instead of markers
+DENSE_ABOVE = 200
+
+
+@dataclass(frozen=True)
+class PlotCfg:
+    nsigma: float = 5.0
+    bar_width: float = 0.5
+    title_fontsize: int = 14
+    show_pmf: bool = True       # exact PMF under H0 as markers over the bars
+
+
+def plot_exact_test(
+    spec: ExactSpec,
+    runs: int = 1000,
+    seed: int | CounterSeed | ThreadedSeed | None = 42,
+    prefer_scipy: bool = True,
+    cfg: PlotCfg = PlotCfg(),
+):
+    """
+    Plot: simulated relative frequencies + exact PMF and critical region under H0.
+    Title shows the exactly attained level a_ex next to the simulated alpha_hat.
+
+    Returns: fig, ax, region, a_ex, a_hat
+    For slider-driven use, keep a BinomExactView and call its update().
+    """
+    view = BinomExactView(spec, runs=runs, seed=seed, prefer_scipy=prefer_scipy, cfg=cfg, blit=False)
+    view.report_build("plot_exact_test")
+    return view.fig, view.ax, view.region, view.a_ex, view.a_hat
+
+
+class BinomExactView(BinomBarsView):
+    """
+    Stateful variant of plot_exact_test.
+    Bars come from bin counts (not raw draws) and live in one PolyCollection;
+    the exact PMF is one Line2D. update(...) only replaces their data.
+    """
+
+    def __init__(
+        self,
+        spec: ExactSpec,
+        runs: int = 1000,
+        seed: int | CounterSeed | ThreadedSeed | None = 42,
+        prefer_scipy: bool = True,
+        cfg: PlotCfg = PlotCfg(),
+        blit: bool | None = None,
+    ):
+        super().__init__(cfg, blit=blit)
+        self.prefer_scipy = prefer_scipy
+        (self._pmf,) = self.ax.plot([], [], "o", color="black", markersize=3, visible=cfg.show_pmf)
+        self._register(self._pmf)
+        self.spec, self.runs, self.seed = spec, runs, seed
+        self._init_data()
+
+    def _set_data(self) -> bool:
+        """Set all data; returns True if the axis limits changed."""
+        spec, runs, cfg = self.spec, self.runs, self.cfg
+
+        res = exact_test(spec, runs=runs, seed=self.seed, prefer_scipy=self.prefer_scipy)
+        region = res.region
+        self.region, self.a_ex, self.a_hat = region, res.a_ex, res.a_hat
+
+        lo, hi, mu, sigma = window_mu_sigma(spec.n, spec.p0, nsigma=cfg.nsigma)
+        k = np.arange(lo, hi + 1)
+        heights = res.counts[lo:hi + 1] / max(runs, 1)
+        pmf = binom_tables(spec.n, spec.p0, self.prefer_scipy).pmf[lo:hi + 1]
+        self._pmf.set_data(k, pmf)
+
+        # with hundreds of bars, edges and markers would cover the colours
+        dense = len(k) > DENSE_ABOVE
+        self._bars.set_linewidths(0.0 if dense else 0.8)
+        self._pmf.set_marker("" if dense else "o")
+        self._pmf.set_linestyle("-" if dense else "")
+
+        # only values that occurred get a bar, as in the raw-draw histogram
+        seen = heights > 0
+        in_region = region_mask(spec.n, region, spec.side)[lo:hi + 1][seen]
+        top = float(heights.max()) if len(heights) else 0.0
+        if cfg.show_pmf and len(pmf):
+            top = max(top, float(pmf.max()))
+        return self._show_bars(
+            k[seen], heights[seen], in_region, region, lo, hi, top,
+            f"Exakt: $\\alpha={spec.alpha}$, erreicht {res.a_ex:.4f}  |  Empirisch: $\\hat\\alpha={res.a_hat:.4f}$",
+        )
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from time import perf_counter
+
 import numpy as np
-import matplotlib.pyplot as plt
 
 from core.binom_test_core import (
     BinomTestSpec, BinomCriticalRegion, Side,
     critical_region, simulate_binom, alpha_hat_from_region, window_mu_sigma
 )
+from plot.incremental import KEEP, IncrementalView, ViewTiming, stable_ymax
 
 
 @dataclass(frozen=True)
@@ -46,57 +48,182 @@ def plot_simulation_vs_exact_region(
     Plot: Simulation (relative frequencies) + exact critical region (computed under H0).
     Window: mu ± nsigma*sigma (clamped to [0,n]).
     Ensures K-text stays inside the plot.
+
+    For slider-driven use, keep a BinomTestView and call its update().
+    """
+    view = BinomTestView(spec, runs=runs, seed=seed, prefer_scipy=prefer_scipy, cfg=cfg, blit=False)
+    view.report_build("plot_simulation_vs_exact_region")
+    return view.fig, view.ax, view.region, view.a_hat
+
+
+def _bar_verts(x: np.ndarray, heights: np.ndarray, width: float) -> np.ndarray:
+    """Rectangles like ax.bar (centred on x) as (len(x),4,2) vertices."""
+    x = np.asarray(x, dtype=float)
+    h = np.asarray(heights, dtype=float)
+    v = np.empty((len(x), 4, 2), dtype=float)
+    v[:, [0, 1], 0] = (x - width / 2.0)[:, None]
+    v[:, [2, 3], 0] = (x + width / 2.0)[:, None]
+    v[:, [0, 3], 1] = 0.0
+    v[:, [1, 2], 1] = h[:, None]
+    return v
+
+
+def _cut_segments(region: BinomCriticalRegion, side: Side) -> list:
+    """Cutoff line(s) between region and acceptance range, in x-axis coordinates."""
+    cuts = []
+    if side in ("right", "two") and region.k_right is not None:
+        cuts.append(((region.k_right - 0.5, 0.0), (region.k_right - 0.5, 1.0)))
+    if side in ("left", "two") and region.k_left is not None:
+        cuts.append(((region.k_left + 0.5, 0.0), (region.k_left + 0.5, 1.0)))
+    return cuts
+
+
+class BinomBarsView(IncrementalView):
+    """
+    Common base of the binomial-test views: one PolyCollection for the bars,
+    one LineCollection for the cutoff(s), title and K-label. Subclasses set
+    spec/runs/seed, implement _set_data() via _show_bars() and call
+    _init_data() at the end of __init__.
     """
-    region = critical_region(spec, prefer_scipy=prefer_scipy)
-    X = simulate_binom(spec.n, spec.p0, runs=runs, seed=seed)
-    a_hat = alpha_hat_from_region(X, region, spec.side)
-
-    lo, hi, mu, sigma = window_mu_sigma(spec.n, spec.p0, nsigma=cfg.nsigma)
-
-    # Histogram on integer support in [lo, hi]
-    vals, counts = np.unique(X, return_counts=True)
-    mask = (vals >= lo) & (vals <= hi)
-    vals = vals[mask]
-    counts = counts[mask]
-
-    fig, ax = plt.subplots(figsize=(8.0, 4.2))
-
-    # colors per bar (only red/blue)
-    colors = ["red" if _is_in_region(int(k), region, spec.side) else "blue" for k in vals]
-
-    ax.bar(
-        vals,
-        counts / runs,
-        width=cfg.bar_width,
-        color=colors,
-        edgecolor="black",
-        linewidth=0.8,
-    )
-
-    # show cutoff(s)
-    if spec.side in ("right", "two") and region.k_right is not None:
-        ax.axvline(region.k_right - 0.5, linestyle="--", linewidth=1.6, color="red")
-    if spec.side in ("left", "two") and region.k_left is not None:
-        ax.axvline(region.k_left + 0.5, linestyle="--", linewidth=1.6, color="red")
-
-    ax.set_xlim(lo - 0.5, hi + 0.5)
-    ax.set_xlabel("realisierte Werte von $X$")
-    ax.set_ylabel("relative Häufigkeit")
-
-    # Title
-    ax.set_title(
-        f"{runs} Realisationen von $X\\sim \\mathrm{{Bin}}({spec.n},{spec.p0})$\n"
-        f"Analytisch (exakt): $\\alpha={spec.alpha}$  |  Empirisch: $\\hat\\alpha={a_hat:.4f}$",
-        fontsize=cfg.title_fontsize,
-    )
-
-    # Put K-label inside window (clamp)
-    ymax = ax.get_ylim()[1]
-    x_text = lo + 0.02 * (hi - lo + 1)
-    y_text = 0.92 * ymax
-    label = _k_label(spec, region)
-
-    ax.text(x_text, y_text, label, color="red", va="top", ha="left")
-
-    fig.tight_layout()
-    return fig, ax, region, a_hat
+
+    def __init__(self, cfg, blit: bool | None = None):
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection, PolyCollection
+
+        fig, ax = plt.subplots(figsize=(8.0, 4.2))
+        super().__init__(fig, ax, blit=blit)
+        self.cfg = cfg
+
+        self._bars = PolyCollection([], edgecolors="black", linewidths=0.8)
+        ax.add_collection(self._bars, autolim=False)
+        self._cuts = LineCollection([], colors="red", linestyles="--", linewidths=1.6)
+        ax.add_collection(self._cuts, autolim=False)
+
+        ax.set_xlabel("realisierte Werte von $X$")
+        ax.set_ylabel("relative Häufigkeit")
+        self._title = ax.set_title("", fontsize=cfg.title_fontsize)
+        self._label = ax.text(0.0, 0.0, "", color="red", va="top", ha="left")
+
+        self._register(self._bars, self._cuts, self._title, self._label)
+        self._limits = None
+
+    def _init_data(self) -> None:
+        t0 = perf_counter()
+        self._set_data()
+        self.init_compute_s = perf_counter() - t0
+        self.fig.tight_layout()
+
+    def _set_data(self) -> bool:
+        raise NotImplementedError
+
+    def _show_bars(
+        self,
+        k: np.ndarray,
+        heights: np.ndarray,
+        in_region: np.ndarray,
+        region: BinomCriticalRegion,
+        lo: int,
+        hi: int,
+        top: float,
+        title: str,
+    ) -> bool:
+        """Set bars, cutoffs, limits and texts; returns True if the axis limits changed."""
+        spec, ax = self.spec, self.ax
+
+        self._bars.set_verts(_bar_verts(k, heights, self.cfg.bar_width))
+        self._bars.set_facecolors(np.where(in_region, "red", "blue"))
+
+        # show cutoff(s), spanning the full axis height
+        self._cuts.set_segments(_cut_segments(region, spec.side))
+        self._cuts.set_transform(ax.get_xaxis_transform())
+
+        # y from 0 with 5 % top margin as ax.bar would autoscale, kept stable
+        # across updates so that new seeds/runs can be blitted
+        ymax = stable_ymax(top, self._limits[3] if self._limits else None)
+        limits = (lo - 0.5, hi + 0.5, 0.0, ymax)
+        changed = limits != self._limits
+        if changed:
+            ax.set_xlim(limits[0], limits[1])
+            ax.set_ylim(limits[2], limits[3])
+            self._limits = limits
+
+        self._title.set_text(
+            f"{self.runs} Realisationen von $X\\sim \\mathrm{{Bin}}({spec.n},{spec.p0})$\n" + title
+        )
+
+        # Put K-label inside window (clamp)
+        self._label.set_position((lo + 0.02 * (hi - lo + 1), 0.92 * ymax))
+        self._label.set_text(_k_label(spec, region))
+        return changed
+
+    def update(
+        self,
+        spec=None,
+        runs: int | None = None,
+        seed=KEEP,
+    ) -> ViewTiming:
+        """
+        Set new parameters and redraw; returns compute/draw timing.
+        Omitted parameters keep their value; seed=None switches to an unseeded run.
+        """
+        t0 = perf_counter()
+        self.spec = self.spec if spec is None else spec
+        self.runs = self.runs if runs is None else runs
+        self.seed = self.seed if seed is KEEP else seed
+        changed = self._set_data()
+        return self._finish(t0, perf_counter(), full=changed)
+
+
+class BinomTestView(BinomBarsView):
+    """
+    Stateful variant of plot_simulation_vs_exact_region.
+    All bars live in one PolyCollection; update(...) only replaces
+    vertices, colors, cutoff lines and texts.
+    """
+
+    def __init__(
+        self,
+        spec: BinomTestSpec,
+        runs: int = 1000,
+        seed: int | None = 42,
+        prefer_scipy: bool = True,
+        cfg: PlotConfig = PlotConfig(),
+        blit: bool | None = None,
+        prefetcher=None,
+    ):
+        super().__init__(cfg, blit=blit)
+        self.prefer_scipy = prefer_scipy
+        # optional core.prefetch_core.binom_test_prefetcher(): neighbouring
+        # slider values are then computed in the background
+        self.prefetcher = prefetcher
+        self.spec, self.runs, self.seed = spec, runs, seed
+        self._init_data()
+
+    def _set_data(self) -> bool:
+        """Set all data; returns True if the axis limits changed."""
+        spec, runs = self.spec, self.runs
+
+        if self.prefetcher is not None:
+            region, counts, a_hat = self.prefetcher.get(
+                n=spec.n, p0=spec.p0, alpha=spec.alpha, side=spec.side,
+                runs=runs, seed=self.seed, prefer_scipy=self.prefer_scipy,
+            )
+        else:
+            region = critical_region(spec, prefer_scipy=self.prefer_scipy)
+            X = simulate_binom(spec.n, spec.p0, runs=runs, seed=self.seed)
+            a_hat = alpha_hat_from_region(X, region, spec.side)
+            counts = np.bincount(X, minlength=spec.n + 1)
+        self.region, self.a_hat = region, a_hat
+
+        lo, hi, mu, sigma = window_mu_sigma(spec.n, spec.p0, nsigma=self.cfg.nsigma)
+
+        # Histogram on integer support in [lo, hi] (values that occurred)
+        vals = np.flatnonzero(counts[lo:hi + 1]) + lo
+        heights = counts[vals] / runs
+
+        in_region = np.array([_is_in_region(int(k), region, spec.side) for k in vals], dtype=bool)
+        top = float(heights.max()) if len(heights) else 0.0
+        return self._show_bars(
+            vals, heights, in_region, region, lo, hi, top,
+            f"Analytisch (exakt): $\\alpha={spec.alpha}$  |  Empirisch: $\\hat\\alpha={a_hat:.4f}$",
+        )
@@ -1,10 +1,151 @@
 from __future__ import annotations
 
 from pathlib import Path
+from time import perf_counter
+
 import numpy as np
-import matplotlib.pyplot as plt
 
-from core.ci_ellipse_core import band_h, z_value, invert_band_to_ci, prognose_schnitte
+from core.ci_ellipse_core import band_ci, band_geometry, z_value, prognose_intervalle
+from plot.incremental import IncrementalView, ViewTiming
+
+
+def _band_verts(p: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """Polygon des gefüllten Bandes (wie fill_between)."""
+    return np.column_stack([np.r_[p, p[::-1]], np.r_[lower, upper[::-1]]])
+
+
+class CIEllipseView(IncrementalView):
+    """
+    Zustandsbehaftete "Konfidenzellipse": Figur und Artists werden einmal
+    aufgebaut, update(...) setzt nur neue Daten (für Slider/Widgets).
+    Darstellung wie plot_ci_ellipse.
+
+    Das Band hängt nur von (n, gamma) ab und gehört zum Hintergrund;
+    ändert sich nur h, werden lediglich die Horizontale, das CI und die
+    Prognoseintervalle neu gezeichnet.
+    """
+
+    def __init__(
+        self,
+        n: int,
+        gamma: float,
+        h_obs: float,
+        k: int = 9,
+        blit: bool | None = None,
+        prefetcher=None,
+    ):
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
+
+        fig, ax = plt.subplots(figsize=(6.2, 4.8))
+        super().__init__(fig, ax, blit=blit)
+
+        # 1) Band (grau gefüllt)
+        self._band = ax.fill_between([0.0, 1.0], [0.0, 0.0], [0.0, 0.0], color="lightgray", alpha=0.6)
+
+        # 2) Bandgrenzen
+        (self._upper,) = ax.plot([], [], color="blue", linewidth=1.5, label="obere Grenze")
+        (self._lower,) = ax.plot([], [], color="green", linewidth=1.5, label="untere Grenze")
+
+        # 3) Beobachtetes h (Realisation)
+        self._h_line = ax.axhline(0.0, color="black", linewidth=1.0, label="Trefferanteil h")
+
+        # 4) Prognoseintervalle (vertikale Schnitte) im CI – eine Collection
+        self._prognose = LineCollection([], colors="black", linewidths=2.0)
+        ax.add_collection(self._prognose, autolim=False)
+
+        # 5) CI unten (rot) und 6) CI oben (rot)
+        self._ci_low = LineCollection([], colors="red", linewidths=4.0, label="Wilson-KI bei h")
+        self._ci_top = LineCollection([], colors="red", linewidths=1.5)
+        ax.add_collection(self._ci_low, autolim=False)
+        ax.add_collection(self._ci_top, autolim=False)
+
+        # Gestrichelte Lotlinien zu pL/pR
+        self._lot = LineCollection([], colors="black", linestyles="--", linewidths=1.2)
+        ax.add_collection(self._lot, autolim=False)
+
+        # Achsen / Layout
+        ax.set_xlim(0.0, 1.0)
+        ax.set_ylim(0.0, 1.0)
+        ax.set_aspect("equal", adjustable="box")  # <- gleiche Skalierung (wichtig!)
+
+        ax.set_xlabel("p", fontsize=14)
+        ax.set_ylabel("h", fontsize=14)
+        self._title = ax.set_title("")
+
+        ax.grid(True, linewidth=1.0, alpha=0.4)
+        ax.legend(loc="upper left", frameon=True)
+
+        # nur die von h abhängigen Artists werden geblittet
+        self._register(
+            self._h_line, self._prognose, self._ci_low, self._ci_top, self._lot, self._title,
+        )
+
+        # optional core.prefetch_core.ellipse_prefetcher(): Bänder benachbarter
+        # (n, gamma) werden dann im Hintergrund vorausberechnet
+        self.prefetcher = prefetcher
+        self.n, self.gamma, self.h_obs, self.k = n, gamma, h_obs, k
+        self.pL = self.pR = float("nan")
+        t0 = perf_counter()
+        self._set_band()
+        self._set_h()
+        self.init_compute_s = perf_counter() - t0
+        fig.tight_layout()
+
+    def _set_band(self) -> None:
+        # Kurven auf adaptivem Gitter, je (n, gamma) zwischengespeichert
+        if self.prefetcher is not None:
+            p, lower, upper = self.prefetcher.get(n=self.n, gamma=self.gamma)
+        else:
+            p, lower, upper = band_geometry(self.n, self.gamma)
+        self._band.set_verts([_band_verts(p, lower, upper)])
+        self._upper.set_data(p, upper)
+        self._lower.set_data(p, lower)
+
+    def _set_h(self) -> None:
+        n, gamma, h_obs, k = self.n, self.gamma, self.h_obs, self.k
+        z = z_value(gamma)
+
+        # CI als Schnitt der Horizontalen h=h_obs mit dem Band
+        pL, pR = band_ci(h_obs, n, z)
+        self.pL, self.pR = pL, pR
+
+        self._h_line.set_ydata([h_obs, h_obs])
+
+        if np.isfinite(pL) and np.isfinite(pR):
+            ps, lo, up = prognose_intervalle(pL, pR, k, n, z)
+            seg = np.empty((len(ps), 2, 2), dtype=float)
+            seg[:, :, 0] = ps[:, None]
+            seg[:, 0, 1] = lo
+            seg[:, 1, 1] = up
+            self._prognose.set_segments(seg)
+            self._ci_low.set_segments([((pL, 0.0), (pR, 0.0))])
+            self._ci_top.set_segments([((pL, h_obs), (pR, h_obs))])
+            self._lot.set_segments([((pL, 0.0), (pL, h_obs)), ((pR, 0.0), (pR, h_obs))])
+        else:
+            for coll in (self._prognose, self._ci_low, self._ci_top, self._lot):
+                coll.set_segments([])
+
+        self._title.set_text(f"Konfidenzellipse bei $n={n}$, $h={h_obs:.3g}$, $\\gamma={gamma:.2f}$")
+
+    def update(
+        self,
+        n: int | None = None,
+        gamma: float | None = None,
+        h_obs: float | None = None,
+        k: int | None = None,
+    ) -> ViewTiming:
+        """Neue Parameter setzen und neu zeichnen; liefert Rechen-/Zeichenzeit."""
+        t0 = perf_counter()
+        band_changed = (n is not None and n != self.n) or (gamma is not None and gamma != self.gamma)
+        self.n = self.n if n is None else n
+        self.gamma = self.gamma if gamma is None else gamma
+        self.h_obs = self.h_obs if h_obs is None else h_obs
+        self.k = self.k if k is None else k
+        if band_changed:
+            self._set_band()
+        self._set_h()
+        return self._finish(t0, perf_counter(), full=band_changed)
 
 
 def plot_ci_ellipse(
@@ -25,79 +166,19 @@ def plot_ci_ellipse(
     - CI für p (aus Band-Schnitt): rote Strecke unten
     - k Prognoseintervalle (vertikale Schnitte) im CI: schwarze Linien
     - gleiche Skalierung (p- und h-Achse)
-    """
-    z = z_value(gamma)
-
-    # Kurven fein genug für glatte Darstellung
-    p = np.linspace(0.0, 1.0, 2000)
-    lower, upper = band_h(p, n, z)
-
-    # CI als Schnitt der Horizontalen h=h_obs mit dem Band
-    pL, pR = invert_band_to_ci(h_obs=h_obs, n=n, gamma=gamma)
-
-    fig, ax = plt.subplots(figsize=(6.2, 4.8))  
-
-    # 1) Band (grau gefüllt)
-    ax.fill_between(
-        p, lower, upper,
-        color="lightgray",
-        alpha=0.6,
-        #label="Konfidenzbereich"
-    )
-
-    # 2) Bandgrenzen
-    ax.plot(p, upper, color="blue", linewidth=1.5, label="obere Grenze")
-    ax.plot(p, lower, color="green", linewidth=1.5, label="untere Grenze")
-
-    # 3) Beobachtetes h (Realisation)
-    ax.axhline(h_obs, color="black", linewidth=1.0, label="Trefferanteil h")
-
-    # 4) Prognoseintervalle (vertikale Schnitte) im CI
-    if np.isfinite(pL) and np.isfinite(pR):
-        ps = prognose_schnitte(pL, pR, k)
-        for pi in ps:
-            lo, up = band_h(np.array([pi]), n, z)
-            ax.vlines(pi, lo[0], up[0], color="black", linewidth=2.0)
-
-        # 5) CI unten (rot) – wie in deinem Bild
-        ax.hlines(
-            y=0.0, xmin=pL, xmax=pR,
-            color="red",
-            linewidth=4.0,
-            label="Wilson-KI bei h"
-        )
-        # 6) CI oben (rot) 
-        ax.hlines(
-            y=h_obs, xmin=pL, xmax=pR,
-            color="red",
-            linewidth=1.5,
-        )
-
-    # Optional: gestrichelte Lotlinien zu pL/pR (wie im Screenshot)
-    ax.vlines(pL, 0.0, h_obs, color="black", linestyles="--", linewidth=1.2)
-    ax.vlines(pR, 0.0, h_obs, color="black", linestyles="--", linewidth=1.2)
 
-    # Achsen / Layout
-    ax.set_xlim(0.0, 1.0)
-    ax.set_ylim(0.0, 1.0)
-    ax.set_aspect("equal", adjustable="box")  # <- gleiche Skalierung (wichtig!)
-
-    ax.set_xlabel("p",fontsize=14)
-    ax.set_ylabel("h",fontsize=14)
-
-    ax.set_title(f"Konfidenzellipse bei $n={n}$, $h={h_obs:.3g}$, $\\gamma={gamma:.2f}$")
-
-    ax.grid(True, linewidth=1.0, alpha=0.4)
-    ax.legend(loc="upper left", frameon=True)
+    Für wiederholte Aufrufe (Slider) besser CIEllipseView verwenden.
+    """
+    import matplotlib.pyplot as plt
 
-    fig.tight_layout()
+    view = CIEllipseView(n=n, gamma=gamma, h_obs=h_obs, k=k, blit=False)
+    view.report_build("plot_ci_ellipse")
 
     if outpath is not None:
-        outpath.parent.mkdir(parents=True, exist_ok=True)
-        fig.savefig(outpath)
+        view.savefig(outpath)
 
     if show:
         plt.show()
 
-    plt.close(fig)
-    return pL, pR
+    view.close()
+    return view.pL, view.pR
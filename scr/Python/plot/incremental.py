@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+
+from core.profiling_core import active
+
+
+class _Keep:
+    def __repr__(self) -> str:
+        return "KEEP"
+
+
+# Standardwert für update(...)-Parameter, bei denen None eine eigene Bedeutung
+# hat (seed=None: ungeseedete Simulation): "bisherigen Wert behalten"
+KEEP = _Keep()
+
+
+def stable_ymax(top: float, current: float | None) -> float:
+    """
+    Obere y-Grenze, die bei kleinen Datenänderungen (neuer Seed, andere
+    runs) gleich bleibt, damit Updates geblittet werden können.
+
+    Erster Aufruf: 5 % Rand wie beim Autoscaling. Danach wird die Grenze nur
+    geändert, wenn die Daten sie überschreiten oder weniger als die Hälfte
+    davon nutzen; dann mit 15 % Reserve.
+    """
+    if top <= 0:
+        return current if current is not None else 1.0
+    if current is None:
+        return 1.05 * top
+    if 0.5 * current <= top <= current:
+        return current
+    return 1.15 * top
+
+
+@dataclass(frozen=True)
+class ViewTiming:
+    """Zeitbedarf eines Updates in Millisekunden."""
+    compute_ms: float
+    draw_ms: float
+    blit: bool
+
+
+class IncrementalView:
+    """
+    Basis für zustandsbehaftete Plots: Artists werden einmal erzeugt und bei
+    Parameteränderungen nur noch mit neuen Daten versehen.
+
+    Unterstützt das Backend Blitting (interaktive Backends, nicht reines Agg),
+    werden nur die veränderlichen Artists neu gezeichnet; ändern sich
+    Achsengrenzen, wird die ganze Figur neu gezeichnet.
+    """
+
+    def __init__(self, fig, ax, blit: bool | None = None):
+        self.fig = fig
+        self.ax = ax
+        self.timing: ViewTiming | None = None
+        self.init_compute_s = 0.0  # Rechenzeit beim Aufbau (von Unterklassen gesetzt)
+        self._dynamic: list = []
+        self._background = None
+        self._saving = False
+
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        canvas = fig.canvas
+        if blit is None:
+            blit = bool(canvas.supports_blit) and type(canvas) is not FigureCanvasAgg
+        self._blit = blit
+        if self._blit:
+            canvas.mpl_connect("draw_event", self._on_draw)
+
+    # --------------------------------------------------------
+    def _register(self, *artists) -> None:
+        """Artists, die sich bei Updates ändern."""
+        for a in artists:
+            if self._blit:
+                a.set_animated(True)
+            self._dynamic.append(a)
+
+    def _on_draw(self, event) -> None:
+        if self._saving:
+            return
+        canvas = self.fig.canvas
+        self._background = canvas.copy_from_bbox(self.fig.bbox)
+        for a in self._dynamic:
+            self.fig.draw_artist(a)
+
+    def _redraw(self, full: bool = False) -> float:
+        """Zeichnet neu und liefert die Dauer in ms."""
+        t0 = perf_counter()
+        canvas = self.fig.canvas
+        if self._blit and not full and self._background is not None:
+            canvas.restore_region(self._background)
+            for a in self._dynamic:
+                self.fig.draw_artist(a)
+            canvas.blit(self.fig.bbox)
+            canvas.flush_events()
+        else:
+            canvas.draw()
+        return (perf_counter() - t0) * 1000.0
+
+    def _finish(self, t_start: float, t_computed: float, full: bool) -> ViewTiming:
+        draw_ms = self._redraw(full=full)
+        self.timing = ViewTiming(
+            compute_ms=(t_computed - t_start) * 1000.0,
+            draw_ms=draw_ms,
+            blit=self._blit and not full,
+        )
+        report = active()
+        if report is not None:
+            name = type(self).__name__
+            report.time(f"{name}.update.compute", self.timing.compute_ms / 1000.0)
+            report.time(f"{name}.update.draw", draw_ms / 1000.0)
+        return self.timing
+
+    def report_build(self, name: str) -> None:
+        """
+        Für das Profiling: Rechenzeit beim Aufbau als `name`.compute und
+        einmal vollständiges Zeichnen (canvas.draw) als `name`.draw melden.
+        Ohne aktives Profiling wird nichts gezeichnet.
+        """
+        report = active()
+        if report is None:
+            return
+        draw_ms = self._redraw(full=True)
+        report.time(f"{name}.compute", self.init_compute_s)
+        report.time(f"{name}.draw", draw_ms / 1000.0)
+
+    # --------------------------------------------------------
+    def savefig(self, outpath: Path, **kwargs) -> None:
+        """Speichert die Figur (auch bei aktivem Blitting vollständig)."""
+        self._saving = True
+        for a in self._dynamic:
+            a.set_animated(False)
+        try:
+            outpath.parent.mkdir(parents=True, exist_ok=True)
+            self.fig.savefig(outpath, **kwargs)
+        finally:
+            self._saving = False
+            if self._blit:
+                for a in self._dynamic:
+                    a.set_animated(True)
+
+    def close(self) -> None:
+        import matplotlib.pyplot as plt
+
+        plt.close(self.fig)
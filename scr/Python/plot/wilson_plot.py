@@ -1,8 +1,141 @@
 from __future__ import annotations
 
 from pathlib import Path
+from time import perf_counter
+from typing import Literal
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+from core.profiling_core import active
+from plot.incremental import IncrementalView, ViewTiming
+
+RenderMode = Literal["auto", "lines", "decimate", "density"]
+
+# Ab dieser Anzahl Intervalle wird automatisch gerastert bzw. verdichtet.
+RASTERIZE_ABOVE = 5_000
+DENSITY_ABOVE = 200_000
+
+
+def _segments(intervals: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """(m,2)-Intervalle -> (m,2,2)-Liniensegmente für eine LineCollection."""
+    seg = np.empty((len(y), 2, 2), dtype=float)
+    seg[:, 0, 0] = intervals[:, 0]
+    seg[:, 1, 0] = intervals[:, 1]
+    seg[:, :, 1] = y[:, None]
+    return seg
+
+
+def _density_image(
+    intervals: np.ndarray,
+    cover: np.ndarray,
+    rows: int,
+    cols: int,
+    colors: tuple[str, str],
+) -> np.ndarray:
+    """
+    RGBA-Bild: pro Zeile (Block von Realisierungen) und Spalte (p-Bereich)
+    der Anteil der Intervalle, die diesen p-Bereich überstreichen.
+    Getroffene und verfehlte Intervalle werden getrennt eingefärbt.
+    """
+    from matplotlib.colors import to_rgb
+
+    m = len(intervals)
+    row = (np.arange(m) * rows) // max(m, 1)
+    c0 = np.clip(np.floor(intervals[:, 0] * cols), 0, cols - 1).astype(np.int64)
+    c1 = np.clip(np.floor(intervals[:, 1] * cols), 0, cols - 1).astype(np.int64)
+
+    rgb = np.zeros((rows, cols, 3), dtype=float)
+    alpha = np.zeros((rows, cols), dtype=float)
+    per_row = np.bincount(row, minlength=rows).astype(float)
+    per_row[per_row == 0] = 1.0
+
+    for mask, color in ((cover, colors[0]), (~cover, colors[1])):
+        # Differenzen-Trick: +1 am Start, -1 hinter dem Ende, dann kumulieren
+        diff = np.zeros((rows, cols + 1), dtype=float)
+        np.add.at(diff, (row[mask], c0[mask]), 1.0)
+        np.add.at(diff, (row[mask], c1[mask] + 1), -1.0)
+        frac = np.cumsum(diff, axis=1)[:, :cols] / per_row[:, None]
+        rgb += frac[..., None] * np.asarray(to_rgb(color))
+        alpha += frac
+
+    img = np.empty((rows, cols, 4), dtype=float)
+    img[..., :3] = rgb / np.maximum(alpha, 1e-12)[..., None]
+    img[..., 3] = np.clip(alpha / max(alpha.max(), 1e-12), 0.0, 1.0)
+    return img
+
+
+def draw_intervals(
+    ax,
+    intervals: np.ndarray,
+    cover: np.ndarray,
+    mode: RenderMode = "auto",
+    colors: tuple[str | None, str | None] = ("blue", "red"),
+    linewidths: tuple[float, float] = (1.6, 1.6),
+    linestyles: tuple[str, str] = ("-", "-"),
+    max_lines: int = 20_000,
+    density_shape: tuple[int, int] = (600, 400),
+):
+    """
+    Zeichnet m Intervalle als höchstens zwei LineCollections (getroffen /
+    verfehlt) direkt aus den Arrays – statt eines Artists pro Intervall.
+
+    mode:
+      - "lines":    alle Intervalle; ab RASTERIZE_ABOVE gerastert
+      - "decimate": höchstens max_lines Intervalle (gleichmäßig ausgedünnt,
+                    verfehlte Intervalle bleiben vollständig erhalten)
+      - "density":  Dichtebild (Anteil überdeckender Intervalle je Pixel)
+      - "auto":     "lines" bis DENSITY_ABOVE, danach "density"
+
+    Gibt die erzeugten Artists zurück.
+    """
+    from matplotlib.collections import LineCollection
+
+    intervals = np.asarray(intervals, dtype=float).reshape(-1, 2)
+    cover = np.asarray(cover, dtype=bool)
+    m = len(intervals)
+    y = np.arange(1, m + 1)
+
+    if mode == "auto":
+        mode = "lines" if m <= DENSITY_ABOVE else "density"
+
+    if mode == "density":
+        rows, cols = density_shape
+        img = _density_image(
+            intervals, cover, min(rows, max(m, 1)), cols,
+            (colors[0] or "C0", colors[1] or "C0"),
+        )
+        im = ax.imshow(
+            img, origin="lower", aspect="auto", interpolation="nearest",
+            extent=(0.0, 1.0, 0.5, m + 0.5),
+        )
+        return [im]
+
+    idx = np.arange(m)
+    if mode == "decimate" and m > max_lines:
+        step = int(np.ceil(m / max_lines))
+        keep = np.zeros(m, dtype=bool)
+        keep[::step] = True
+        keep |= ~cover
+        idx = idx[keep]
+    elif mode not in ("lines", "decimate"):
+        raise ValueError(f"Unbekannter Modus: {mode!r}")
+
+    rasterized = len(idx) > RASTERIZE_ABOVE
+    artists = []
+    for sel, color, lw, ls in (
+        (idx[cover[idx]], colors[0], linewidths[0], linestyles[0]),
+        (idx[~cover[idx]], colors[1], linewidths[1], linestyles[1]),
+    ):
+        if len(sel) == 0:
+            continue
+        lc = LineCollection(
+            _segments(intervals[sel], y[sel]),
+            colors=color, linewidths=lw, linestyles=ls,
+        )
+        lc.set_rasterized(rasterized)
+        ax.add_collection(lc, autolim=False)
+        artists.append(lc)
+    return artists
 
 
 def plot_intervals(
@@ -12,21 +145,23 @@ def plot_intervals(
     title: str,
     show: bool = True,
     outpath: Path | None = None,
+    mode: RenderMode = "auto",
 ):
     """
     Reine Darstellung: plotten (und optional speichern).
     Keine Simulation, keine Statistiklogik.
+
+    mode: siehe draw_intervals ("auto" | "lines" | "decimate" | "density").
     """
+    import matplotlib.pyplot as plt
+
     m = len(intervals)
-    y = np.arange(1, m + 1)
 
     fig, ax = plt.subplots(figsize=(4.2, 6.2))
 
-    for i, (L, R) in enumerate(intervals):
-        if cover[i]:
-            ax.hlines(y[i], L, R, linewidth=1.6, color="blue")
-        else:
-            ax.hlines(y[i], L, R, linewidth=1.6, color="red")
+    t0 = perf_counter()
+    draw_intervals(ax, intervals, cover, mode=mode)
+    t_compute = perf_counter() - t0
 
     ax.axvline(p_true, linewidth=1.5, color="gray")
 
@@ -38,6 +173,7 @@ def plot_intervals(
 
     fig.tight_layout()
 
+    t0 = perf_counter()
     if outpath is not None:
         outpath.parent.mkdir(parents=True, exist_ok=True)
         fig.savefig(outpath)
@@ -45,4 +181,75 @@ def plot_intervals(
     if show:
         plt.show()
 
+    report = active()
+    if report is not None:
+        report.time("plot_intervals.compute", t_compute)
+        report.time("plot_intervals.draw", perf_counter() - t0)
+
     plt.close(fig)
+
+
+class IntervalsView(IncrementalView):
+    """
+    Zustandsbehaftete Variante von plot_intervals (Modus "lines"):
+    zwei LineCollections werden einmal angelegt, update(...) setzt nur
+    neue Segmente, p_true und Titel.
+    """
+
+    def __init__(
+        self,
+        intervals: np.ndarray,
+        cover: np.ndarray,
+        p_true: float,
+        title: str,
+        blit: bool | None = None,
+    ):
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
+
+        fig, ax = plt.subplots(figsize=(4.2, 6.2))
+        super().__init__(fig, ax, blit=blit)
+
+        self._hit = LineCollection([], colors="blue", linewidths=1.6)
+        self._miss = LineCollection([], colors="red", linewidths=1.6)
+        ax.add_collection(self._hit, autolim=False)
+        ax.add_collection(self._miss, autolim=False)
+        self._p_line = ax.axvline(p_true, linewidth=1.5, color="gray")
+
+        ax.set_xlim(0.0, 1.0)
+        ax.set_xlabel("p")
+        ax.set_ylabel("Realisierung")
+        self._title = ax.set_title(title)
+
+        self._register(self._hit, self._miss, self._p_line, self._title)
+        self._m = None
+        t0 = perf_counter()
+        self._set_data(intervals, cover, p_true, title)
+        self.init_compute_s = perf_counter() - t0
+        fig.tight_layout()
+
+    def _set_data(self, intervals, cover, p_true, title) -> bool:
+        intervals = np.asarray(intervals, dtype=float).reshape(-1, 2)
+        cover = np.asarray(cover, dtype=bool)
+        m = len(intervals)
+        y = np.arange(1, m + 1)
+
+        self._hit.set_segments(_segments(intervals[cover], y[cover]))
+        self._miss.set_segments(_segments(intervals[~cover], y[~cover]))
+        rasterized = m > RASTERIZE_ABOVE
+        self._hit.set_rasterized(rasterized)
+        self._miss.set_rasterized(rasterized)
+        self._p_line.set_xdata([p_true, p_true])
+        self._title.set_text(title)
+
+        changed = m != self._m
+        if changed:
+            self.ax.set_ylim(0, m + 1)
+            self._m = m
+        return changed
+
+    def update(self, intervals, cover, p_true: float, title: str) -> ViewTiming:
+        """Neue Intervalle setzen und neu zeichnen; liefert Rechen-/Zeichenzeit."""
+        t0 = perf_counter()
+        changed = self._set_data(intervals, cover, p_true, title)
+        return self._finish(t0, perf_counter(), full=changed)
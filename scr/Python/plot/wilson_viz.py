@@ -1,24 +1,23 @@
 # scr/Python/plot/wilson_viz.py
-import matplotlib.pyplot as plt
-import numpy as np
+from core.wilson_core import simulate_wilson_intervals
+from plot.wilson_plot import draw_intervals
 
-from core.wilson_core import simulate_intervals
 
+def simulate_and_show(n, p_true, gamma, m, seed, mode="auto"):
+    import matplotlib.pyplot as plt
 
-def simulate_and_show(n, p_true, gamma, m, seed):
-    intervals, cover, coverage_rate = simulate_intervals(
+    intervals, cover, coverage_rate = simulate_wilson_intervals(
         n=n, p_true=p_true, gamma=gamma, m=m, seed=seed
     )
 
-    y = np.arange(1, m + 1)
     fig, ax = plt.subplots(figsize=(4.2, 6.2))
 
-    for i, (L, R) in enumerate(intervals):
-        ax.hlines(
-            y[i], L, R,
-            linewidth=(2.2 if cover[i] else 3.0),
-            linestyles=("-" if cover[i] else "--")
-        )
+    draw_intervals(
+        ax, intervals, cover, mode=mode,
+        colors=(None, None),
+        linewidths=(2.2, 3.0),
+        linestyles=("-", "--"),
+    )
 
     ax.axvline(p_true, linewidth=2.0)
     ax.set_ylim(0, m + 1)
@@ -3,8 +3,8 @@ from __future__ import annotations
 
 from fractions import Fraction
 
-from core import exact_probabilities_fraction, simulate_many
-from plot import plot_sim_vs_exact
+from core.Setzstrategien_core import exact_probabilities_fraction, simulate_many
+from plot.Setzstrategien_plot import plot_sim_vs_exact
 
 
 def main():
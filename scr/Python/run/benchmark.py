@@ -0,0 +1,387 @@
+"""
+Lokale Benchmarks der Kernfunktionen (offline, ohne Zusatzpakete).
+
+Jede Messreihe variiert den Parameter, der die Laufzeit treibt (n, runs,
+m, Chipzahl, Feldanzahl, Gittergröße), und liefert so eine Skalierungskurve.
+Ergebnisse werden als JSON je Commit in bench/results/ abgelegt und gegen
+eine gespeicherte Baseline (bench/baseline.json) verglichen.
+
+Aufruf (aus scr/Python):
+    python -m run.benchmark                   # messen, speichern, vergleichen
+    python -m run.benchmark --quick           # kleinere Parameter
+    python -m run.benchmark --save-baseline   # aktuelle Messung als Baseline
+    python -m run.benchmark --only critical_region
+    python -m run.benchmark --check-imports   # Startzeit-Budget für core prüfen
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+BENCH_DIR = PROJECT_ROOT / "bench"
+BASELINE = BENCH_DIR / "baseline.json"
+
+# Spielbrett aus Setzstrategien_run
+BOARD_P = [Fraction(3, 18), Fraction(5, 18), Fraction(4, 18), Fraction(3, 18), Fraction(2, 18), Fraction(1, 18)]
+BOARD_A = [3, 5, 4, 3, 2, 1]
+BOARD_B = [3, 7, 4, 3, 1, 0]
+
+
+def _package_modules(package: str) -> Tuple[str, ...]:
+    """Alle Module eines Pakets (aus den .py-Dateien, ohne __init__)."""
+    directory = Path(__file__).resolve().parents[1] / package
+    return tuple(sorted(f"{package}.{f.stem}" for f in directory.glob("*.py") if f.stem != "__init__"))
+
+
+# Startzeit-Budget: Stapel-Worker importieren nur core – alle Module, auch neu hinzukommende
+CORE_MODULES = _package_modules("core")
+HEAVY_MODULES = ("matplotlib", "scipy", "pandas")
+CORE_IMPORT_BUDGET_S = 0.5
+
+
+@dataclass(frozen=True)
+class Measurement:
+    name: str
+    params: Dict[str, Any]
+    min_s: float
+    median_s: float
+    repeats: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{json.dumps(self.params, sort_keys=True)}]"
+
+
+# ============================================================
+# Messen
+# ============================================================
+
+def time_call(fn: Callable[[], Any], min_time: float = 0.2, max_repeats: int = 50) -> Tuple[float, float, int]:
+    """
+    Ruft fn wiederholt auf, bis min_time erreicht ist (mind. 3x, höchstens
+    max_repeats). Liefert (Minimum, Median, Anzahl) in Sekunden.
+    """
+    times: List[float] = []
+    total = 0.0
+    while len(times) < 3 or (total < min_time and len(times) < max_repeats):
+        t0 = time.perf_counter()
+        fn()
+        dt = time.perf_counter() - t0
+        times.append(dt)
+        total += dt
+    return min(times), statistics.median(times), len(times)
+
+
+def _board(fields: int, scale: int = 1) -> Tuple[List[Fraction], List[int], List[int]]:
+    """Die ersten `fields` Felder des Standardbretts, p renormiert, Chips * scale."""
+    p = BOARD_P[:fields]
+    s = sum(p)
+    return [pi / s for pi in p], [a * scale for a in BOARD_A[:fields]], [b * scale for b in BOARD_B[:fields]]
+
+
+def measure_import(modules: Iterable[str] = CORE_MODULES) -> Tuple[float, List[str]]:
+    """
+    Importiert `modules` in einem frischen Interpreter.
+    Returns (Sekunden, dabei geladene schwere Pakete aus HEAVY_MODULES).
+    """
+    code = (
+        "import json, sys, time\n"
+        "t = time.perf_counter()\n"
+        f"for m in {list(modules)!r}: __import__(m)\n"
+        "dt = time.perf_counter() - t\n"
+        f"heavy = [m for m in {list(HEAVY_MODULES)!r} if m in sys.modules]\n"
+        "print(json.dumps([dt, heavy]))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True, text=True, check=True,
+    )
+    dt, heavy = json.loads(out.stdout.strip().splitlines()[-1])
+    return float(dt), list(heavy)
+
+
+def check_import_budget(budget_s: float = CORE_IMPORT_BUDGET_S, tries: int = 5) -> List[str]:
+    """
+    Prüft, dass `import core.*` ohne matplotlib/SciPy/pandas auskommt und
+    (bestes von `tries` Versuchen) unter budget_s bleibt. Returns: Fehlermeldungen.
+    """
+    runs = [measure_import() for _ in range(tries)]
+    best = min(dt for dt, _ in runs)
+    heavy = sorted({m for _, hs in runs for m in hs})
+    errors = []
+    if heavy:
+        errors.append(f"core lädt beim Import: {', '.join(heavy)}")
+    if best > budget_s:
+        errors.append(f"Import von core dauert {best:.3f} s (Budget {budget_s:.3f} s)")
+    print(f"import core.*: {best * 1e3:.1f} ms (Budget {budget_s * 1e3:.0f} ms)")
+    return errors
+
+
+def _agg() -> None:
+    import matplotlib
+
+    matplotlib.use("Agg", force=True)
+
+
+# ============================================================
+# Messreihen
+# ============================================================
+
+def bench_simulate_game(quick: bool) -> Iterable[Tuple[Dict[str, Any], Callable[[], Any]]]:
+    import random
+
+    from core.Setzstrategien_core import simulate_game
+
+    for scale in (1, 2) if quick else (1, 2, 4):
+        p, A, B = _board(6, scale)
+        pf = [float(x) for x in p]
+        random.seed(0)
+        yield {"chip_scale": scale, "chips": sum(A) + sum(B)}, lambda pf=pf, A=A, B=B: simulate_game(pf, A, B)
+
+
+def bench_simulate_many(quick: bool) -> Iterable[Tuple[Dict[str, Any], Callable[[], Any]]]:
+    import random
+
+    from core.Setzstrategien_core import simulate_many
+
+    p, A, B = _board(6)
+    pf = [float(x) for x in p]
+    for runs in (200, 2_000) if quick else (1_000, 10_000, 50_000):
+        random.seed(0)
+        yield {"n_runs": runs}, lambda runs=runs: simulate_many(pf, A, B, n_runs=runs)
+
+
+def bench_exact_probabilities(quick: bool) -> Iterable[Tuple[Dict[str, Any], Callable[[], Any]]]:
+    from core.Setzstrategien_core import exact_probabilities_fraction
+
+    for fields in (3, 4, 5) if quick else (3, 4, 5, 6):
+        p, A, B = _board(fields)
+        yield {"fields": fields}, lambda p=p, A=A, B=B: exact_probabilities_fraction(p, A, B)
+
+
+def bench_critical_region(quick: bool) -> Iterable[Tuple[Dict[str, Any], Callable[[], Any]]]:
+    from core.binom_test_core import BinomTestSpec, critical_region
+
+    sizes_scipy = (100, 1_000) if quick else (100, 1_000, 10_000)
+    sizes_exact = (50, 200) if quick else (50, 200, 1_000)
+    for backend, sizes in (("scipy", sizes_scipy), ("exact", sizes_exact)):
+        for n in sizes:
+            for side in ("right", "two"):
+                spec = BinomTestSpec(n=n, p0=0.5, alpha=0.05, side=side)
+                yield (
+                    {"backend": backend, "n": n, "side": side},
+                    lambda spec=spec, b=backend: critical_region(spec, prefer_scipy=(b == "scipy")),
+                )
+
+
+def bench_pmf_recursion(quick: bool) -> Iterable[Tuple[Dict[str, Any], Callable[[], Any]]]:
+    from core.binom_test_core import _pmf_recursion
+
+    for n in (1_000, 10_000) if quick else (1_000, 10_000, 100_000):
+        yield {"n": n}, lambda n=n: _pmf_recursion(n, 0.3)
+
+
+def bench_simulate_wilson(quick: bool) -> Iterable[Tuple[Dict[str, Any], Callable[[], Any]]]:
+    from core.wilson_core import simulate_wilson_intervals
+
+    for m in (1_000, 100_000) if quick else (1_000, 100_000, 1_000_000):
+        yield {"m": m, "n": 80}, lambda m=m: simulate_wilson_intervals(80, 0.6, 0.95, m, seed=1)
+
+
+def bench_invert_band(quick: bool) -> Iterable[Tuple[Dict[str, Any], Callable[[], Any]]]:
+    from core.ci_ellipse_core import invert_band_to_ci
+
+    for grid in (2_001, 20_001) if quick else (2_001, 20_001, 200_001):
+        yield {"grid": grid}, lambda grid=grid: invert_band_to_ci(0.63, 80, 0.95, grid=grid)
+
+
+def bench_plots(quick: bool) -> Iterable[Tuple[Dict[str, Any], Callable[[], Any]]]:
+    _agg()
+    import matplotlib.pyplot as plt
+
+    from core.binom_test_core import BinomTestSpec
+    from core.wilson_core import simulate_wilson_intervals
+    from plot.binom_test_plot import plot_simulation_vs_exact_region
+    from plot.ci_ellipse_plot import plot_ci_ellipse
+    from plot.wilson_plot import plot_intervals
+
+    # Ausgabe in eine Datei, damit tatsächlich gerendert wird
+    tmp = Path(tempfile.mkdtemp(prefix="kit-bench-"))
+    png = tmp / "bench.png"
+
+    def render(fig) -> None:
+        fig.savefig(png)
+        plt.close(fig)
+
+    yield {"plot": "ci_ellipse"}, lambda: plot_ci_ellipse(80, 0.95, 0.63, show=False, outpath=png)
+
+    for m in (100, 10_000) if quick else (100, 10_000, 100_000):
+        iv, cover, _ = simulate_wilson_intervals(80, 0.6, 0.95, m, seed=7)
+        yield (
+            {"plot": "intervals", "m": m},
+            lambda iv=iv, cover=cover: plot_intervals(iv, cover, 0.6, "bench", show=False, outpath=png),
+        )
+
+    for runs in (1_000, 100_000) if quick else (1_000, 100_000, 1_000_000):
+        spec = BinomTestSpec(n=100, p0=0.6, alpha=0.05, side="two")
+        yield (
+            {"plot": "binom_test", "runs": runs},
+            lambda spec=spec, runs=runs: render(plot_simulation_vs_exact_region(spec, runs=runs)[0]),
+        )
+
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
+def bench_import(quick: bool) -> Iterable[Tuple[Dict[str, Any], Callable[[], Any]]]:
+    for group, modules in (
+        ("core", CORE_MODULES),
+        ("plot", _package_modules("plot")),
+    ):
+        yield {"modules": group}, lambda modules=modules: measure_import(modules)
+
+
+SUITES: Dict[str, Callable[[bool], Iterable[Tuple[Dict[str, Any], Callable[[], Any]]]]] = {
+    "import": bench_import,
+    "simulate_game": bench_simulate_game,
+    "simulate_many": bench_simulate_many,
+    "exact_probabilities_fraction": bench_exact_probabilities,
+    "critical_region": bench_critical_region,
+    "_pmf_recursion": bench_pmf_recursion,
+    "simulate_wilson_intervals": bench_simulate_wilson,
+    "invert_band_to_ci": bench_invert_band,
+    "plots": bench_plots,
+}
+
+
+# ============================================================
+# Ausführen / Speichern / Vergleichen
+# ============================================================
+
+def run_benchmarks(quick: bool = False, only: List[str] | None = None) -> List[Measurement]:
+    results: List[Measurement] = []
+    for name, suite in SUITES.items():
+        if only and name not in only:
+            continue
+        for params, fn in suite(quick):
+            mn, med, reps = time_call(fn)
+            m = Measurement(name=name, params=params, min_s=mn, median_s=med, repeats=reps)
+            print(f"{m.key:70s} {mn * 1e3:10.3f} ms  (median {med * 1e3:.3f}, {reps}x)")
+            results.append(m)
+    return results
+
+
+def _git(*args: str) -> str:
+    try:
+        out = subprocess.run(["git", *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def environment() -> Dict[str, Any]:
+    import numpy as np
+
+    commit = _git("rev-parse", "--short", "HEAD") or "unknown"
+    dirty = bool(_git("status", "--porcelain", "--untracked-files=no"))
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+def save_results(results: List[Measurement], env: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"env": env, "results": [asdict(r) for r in results]}
+    path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+
+
+def load_results(path: Path) -> Dict[str, Measurement]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    ms = [Measurement(**r) for r in data["results"]]
+    return {m.key: m for m in ms}
+
+
+def compare(
+    results: List[Measurement], baseline: Dict[str, Measurement], tolerance: float = 0.25
+) -> List[Tuple[str, float]]:
+    """
+    Vergleicht Minimalzeiten mit der Baseline.
+    Returns: Liste (key, Faktor) aller Messungen, die um mehr als tolerance langsamer sind.
+    """
+    regressions: List[Tuple[str, float]] = []
+    for m in results:
+        ref = baseline.get(m.key)
+        if ref is None or ref.min_s <= 0:
+            continue
+        ratio = m.min_s / ref.min_s
+        flag = ""
+        if ratio > 1.0 + tolerance:
+            regressions.append((m.key, ratio))
+            flag = "  <-- REGRESSION"
+        elif ratio < 1.0 / (1.0 + tolerance):
+            flag = "  (schneller)"
+        print(f"{m.key:70s} x{ratio:6.2f}{flag}")
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks der Kernfunktionen.")
+    parser.add_argument("--quick", action="store_true", help="kleinere Parameterbereiche")
+    parser.add_argument("--only", nargs="*", choices=sorted(SUITES), help="nur diese Messreihen")
+    parser.add_argument("--save-baseline", action="store_true", help="Messung als Baseline speichern")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="erlaubte Verlangsamung (0.25 = 25 %%)")
+    parser.add_argument("--check-imports", action="store_true", help="nur das Startzeit-Budget von core prüfen")
+    args = parser.parse_args(argv)
+
+    if args.check_imports:
+        errors = check_import_budget()
+        for e in errors:
+            print("FEHLER:", e)
+        return 1 if errors else 0
+
+    env = environment()
+    results = run_benchmarks(quick=args.quick, only=args.only)
+
+    name = env["commit"] + ("-dirty" if env["dirty"] else "") + ("-quick" if args.quick else "")
+    out = BENCH_DIR / "results" / f"{name}.json"
+    save_results(results, env, out)
+    print(f"\nErgebnisse: {out}")
+
+    if args.save_baseline:
+        save_results(results, env, args.baseline)
+        print(f"Baseline gespeichert: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("Keine Baseline vorhanden (--save-baseline).")
+        return 0
+
+    print(f"\nVergleich mit {args.baseline}:")
+    regressions = compare(results, load_results(args.baseline), tolerance=args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} Regression(en) über {args.tolerance:.0%}.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,3 +30,46 @@ def show_binom_exact(
     plt.show()
     plt.close(fig)
     return region, a_ex, a_hat
+
+
+def interactive_binom_exact(
+    n: int = 80,
+    p0: float = 0.5,
+    alpha: float = 0.05,
+    runs: int = 1000,
+    seed: int | None = 42,
+    side: str = "right",
+    nsigma: float = 5.0,
+    prefer_scipy: bool = True,
+):
+    """
+    Slider-Variante für das Notebook: die Figur wird einmal aufgebaut, jede
+    Slider-Bewegung ruft nur BinomExactView.update(...) auf.
+
+    Im Notebook vorher `%matplotlib widget` (ipympl), damit die Figur an Ort
+    und Stelle aktualisiert wird.
+
+    Returns: (view, controls)
+    """
+    import ipywidgets as widgets
+    from IPython.display import display
+
+    from plot.binom_exact_plot import BinomExactView
+
+    spec = ExactSpec(n=n, p0=p0, alpha=alpha, side=side)  # type: ignore[arg-type]
+    view = BinomExactView(spec, runs=runs, seed=seed, prefer_scipy=prefer_scipy, cfg=PlotCfg(nsigma=nsigma))
+
+    def on_change(n, p0, alpha, side, runs):
+        view.update(spec=ExactSpec(n=n, p0=p0, alpha=alpha, side=side), runs=runs)
+
+    controls = widgets.interactive(
+        on_change,
+        n=widgets.IntSlider(value=n, min=1, max=max(1000, n)),
+        p0=widgets.FloatSlider(value=p0, min=0.01, max=0.99, step=0.01),
+        alpha=widgets.FloatSlider(value=alpha, min=0.01, max=0.5, step=0.01),
+        side=widgets.Dropdown(options=["left", "right", "two"], value=side),
+        runs=widgets.IntSlider(value=runs, min=100, max=max(100_000, runs), step=100),
+    )
+    display(controls)
+    plt.show()
+    return view, controls
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import matplotlib.pyplot as plt
+
+from core.binom_test_core import BinomTestSpec
+from plot.binom_test_plot import plot_simulation_vs_exact_region, PlotConfig
+
+
+def show_binom_test(
+    n: int = 100,
+    p0: float = 0.6,
+    alpha: float = 0.05,
+    runs: int = 10000,
+    seed: int | None = 42,
+    side: str = "right",     # "left" | "right" | "two"
+    nsigma: float = 5.0,
+    prefer_scipy: bool = True,
+):
+    spec = BinomTestSpec(n=n, p0=p0, alpha=alpha, side=side)  # type: ignore[arg-type]
+    cfg = PlotConfig(nsigma=nsigma)
+
+    fig, ax, region, a_hat = plot_simulation_vs_exact_region(
+        spec=spec,
+        runs=runs,
+        seed=seed,
+        prefer_scipy=prefer_scipy,
+        cfg=cfg,
+    )
+
+    plt.show()
+    plt.close(fig)
+    return region, a_hat
+
+
+def interactive_binom_test(
+    n: int = 100,
+    p0: float = 0.6,
+    alpha: float = 0.05,
+    runs: int = 10000,
+    seed: int | None = 42,
+    side: str = "right",
+    nsigma: float = 5.0,
+    prefer_scipy: bool = True,
+    prefetch: bool = True,
+):
+    """
+    Slider-Variante für das Notebook: die Figur wird einmal aufgebaut, jede
+    Slider-Bewegung ruft nur BinomTestView.update(...) auf (Blitting, wenn
+    die Achsengrenzen gleich bleiben). Benachbarte Sliderwerte werden mit
+    prefetch=True im Hintergrund vorausberechnet.
+
+    Im Notebook vorher `%matplotlib widget` (ipympl), damit die Figur an Ort
+    und Stelle aktualisiert wird.
+
+    Returns: (view, controls)
+    """
+    import ipywidgets as widgets
+    from IPython.display import display
+
+    from core.prefetch_core import binom_test_prefetcher
+    from plot.binom_test_plot import BinomTestView
+
+    spec = BinomTestSpec(n=n, p0=p0, alpha=alpha, side=side)  # type: ignore[arg-type]
+    view = BinomTestView(
+        spec, runs=runs, seed=seed, prefer_scipy=prefer_scipy, cfg=PlotConfig(nsigma=nsigma),
+        prefetcher=binom_test_prefetcher() if prefetch else None,
+    )
+
+    def on_change(n, p0, alpha, side, runs):
+        view.update(spec=BinomTestSpec(n=n, p0=p0, alpha=alpha, side=side), runs=runs)
+
+    controls = widgets.interactive(
+        on_change,
+        n=widgets.IntSlider(value=n, min=1, max=max(1000, n)),
+        p0=widgets.FloatSlider(value=p0, min=0.01, max=0.99, step=0.01),
+        alpha=widgets.FloatSlider(value=alpha, min=0.01, max=0.5, step=0.01),
+        side=widgets.Dropdown(options=["left", "right", "two"], value=side),
+        runs=widgets.IntSlider(value=runs, min=100, max=max(100_000, runs), step=100),
+    )
+    display(controls)
+    plt.show()
+    return view, controls
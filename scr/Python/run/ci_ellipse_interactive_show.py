@@ -1,14 +1,56 @@
 from plot.ci_ellipse_plot import plot_ci_ellipse
 
-# =========================
-# Setzungen (hier ändern!)
-# =========================
-n = 80
-gamma = 0.95
-h = 0.63
 
-k = 9  # Anzahl der sichtbaren Prognoseintervalle im CI
+def interactive_ci_ellipse(
+    n: int = 80, gamma: float = 0.95, h: float = 0.63, k: int = 9, prefetch: bool = True
+):
+    """
+    Slider-Variante für das Notebook: die Figur wird einmal aufgebaut, jede
+    Slider-Bewegung ruft nur CIEllipseView.update(...) auf; ändert sich nur h,
+    wird das Band nicht neu gezeichnet. Bänder benachbarter Sliderwerte von
+    n und gamma werden mit prefetch=True im Hintergrund vorausberechnet.
 
-pL, pR = plot_ci_ellipse(n=n, gamma=gamma, h_obs=h, k=k, show=True, outpath=None)
+    Im Notebook vorher `%matplotlib widget` (ipympl), damit die Figur an Ort
+    und Stelle aktualisiert wird.
 
-print("CI (aus Band-Schnitt):", (round(pL, 4), round(pR, 4)))
+    Returns: (view, controls)
+    """
+    import ipywidgets as widgets
+    import matplotlib.pyplot as plt
+    from IPython.display import display
+
+    from core.prefetch_core import ellipse_prefetcher
+    from plot.ci_ellipse_plot import CIEllipseView
+
+    view = CIEllipseView(
+        n=n, gamma=gamma, h_obs=h, k=k, prefetcher=ellipse_prefetcher() if prefetch else None,
+    )
+
+    def on_change(n, gamma, h, k):
+        view.update(n=n, gamma=gamma, h_obs=h, k=k)
+
+    controls = widgets.interactive(
+        on_change,
+        n=widgets.IntSlider(value=n, min=5, max=max(500, n)),
+        gamma=widgets.FloatSlider(value=gamma, min=0.5, max=0.99, step=0.01),
+        h=widgets.FloatSlider(value=h, min=0.0, max=1.0, step=0.01),
+        k=widgets.IntSlider(value=k, min=1, max=25),
+    )
+    display(controls)
+    plt.show()
+    return view, controls
+
+
+if __name__ == "__main__":
+    # =========================
+    # Setzungen (hier ändern!)
+    # =========================
+    n = 80
+    gamma = 0.95
+    h = 0.63
+
+    k = 9  # Anzahl der sichtbaren Prognoseintervalle im CI
+
+    pL, pR = plot_ci_ellipse(n=n, gamma=gamma, h_obs=h, k=k, show=True, outpath=None)
+
+    print("CI (aus Band-Schnitt):", (round(pL, 4), round(pR, 4)))
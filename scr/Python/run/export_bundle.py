@@ -0,0 +1,328 @@
+"""
+Vorberechnete Bildfolgen für die interaktiven Demos – ohne Python abspielbar.
+
+Für ein Parametergitter wird jede Kombination parallel mit derselben View
+gezeichnet, die auch die Notebook-Slider benutzen – aber in zwei Ebenen:
+
+- Hintergrund: Achsen, Beschriftung, Legende, Band der Ellipse usw. (alles,
+  was die View bei einem Update nicht anfasst). Er hängt nur von wenigen
+  Parametern ab und wird von vielen Kombinationen geteilt.
+- Daten: nur die veränderlichen Artists (Balken, Intervalle, Schnitte,
+  Beschriftung von K) auf transparentem Grund; klein und oft ebenfalls
+  mehrfach identisch (z. B. gleicher Bereich bei anderem alpha).
+
+Der Titel (mit Parametern und Schätzwerten) steht als Text in der HTML-Datei.
+Identische Ebenen werden nur einmal abgelegt; alles zusammen landet in einer
+einzigen HTML-Datei mit Schiebereglern, die sich in jedem Browser (oder als
+statische Seite, z. B. GitHub Pages) ohne Kernel durchblättern lässt.
+
+Aufruf (aus scr/Python):
+    python -m run.export_bundle grid.json --out ../../fig/demos.html --workers 8
+
+grid.json, z. B.:
+    {"ci_ellipse": {"n": [20, 50, 100], "gamma": [0.9, 0.95, 0.99], "h_obs": [0.3, 0.5, 0.7]},
+     "binom_test": {"n": [50, 100], "p0": [0.5, 0.6], "alpha": [0.05], "side": ["left", "right", "two"]}}
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from run.render_figures import PROJECT_ROOT, expand_grid
+
+DEFAULT_OUT = PROJECT_ROOT / "fig" / "demos.html"
+DEFAULT_DPI = 80
+
+
+# ============================================================
+# Views je Grafiktyp
+# ============================================================
+
+def _view_ci_ellipse(params: Dict[str, Any]):
+    from plot.ci_ellipse_plot import CIEllipseView
+
+    return CIEllipseView(n=params["n"], gamma=params["gamma"], h_obs=params["h_obs"], k=params.get("k", 9), blit=False)
+
+
+def _view_wilson_intervals(params: Dict[str, Any]):
+    from core.wilson_core import simulate_wilson_intervals
+    from plot.wilson_plot import IntervalsView
+
+    n, p_true, gamma, m = params["n"], params["p_true"], params["gamma"], params["m"]
+    seed = params.get("seed", 7)
+    intervals, cover, rate = simulate_wilson_intervals(n=n, p_true=p_true, gamma=gamma, m=m, seed=seed)
+    title = (
+        f"{m} Intervalle (Wilson), n={n}, γ={gamma:.2f}\n"
+        f"Trefferquote ≈ {rate:.2f}  |  Seed {seed}"
+    )
+    return IntervalsView(intervals, cover, p_true, title, blit=False)
+
+
+def _view_binom_test(params: Dict[str, Any]):
+    from core.binom_test_core import BinomTestSpec
+    from plot.binom_test_plot import BinomTestView
+
+    spec = BinomTestSpec(n=params["n"], p0=params["p0"], alpha=params["alpha"], side=params.get("side", "right"))
+    return BinomTestView(spec, runs=params.get("runs", 1000), seed=params.get("seed", 42), blit=False)
+
+
+def _view_binom_exact(params: Dict[str, Any]):
+    from core.binom_exact_core import ExactSpec
+    from plot.binom_exact_plot import BinomExactView
+
+    spec = ExactSpec(n=params["n"], p0=params["p0"], alpha=params["alpha"], side=params.get("side", "right"))
+    return BinomExactView(spec, runs=params.get("runs", 1000), seed=params.get("seed", 42), blit=False)
+
+
+VIEWS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "ci_ellipse": _view_ci_ellipse,
+    "wilson_intervals": _view_wilson_intervals,
+    "binom_test": _view_binom_test,
+    "binom_exact": _view_binom_exact,
+}
+
+
+# ============================================================
+# Rendern
+# ============================================================
+
+_MATH = [
+    (r"\hat\alpha", "α̂"), (r"\alpha", "α"), (r"\gamma", "γ"), (r"\sim", "~"),
+    (r"\geq", "≥"), (r"\leq", "≤"), (r"\{", "{"), (r"\}", "}"), (r"\ ", " "), ("$", ""),
+]
+
+
+def _plain(text: str) -> str:
+    """Mathtext des Titels als lesbarer Unicode-Text für HTML."""
+    text = re.sub(r"\\(?:mathrm|text)\{([^{}]*)\}", r"\1", text)
+    for tex, uni in _MATH:
+        text = text.replace(tex, uni)
+    return text
+
+
+def _init_worker() -> None:
+    import matplotlib
+
+    matplotlib.use("Agg", force=True)
+
+
+def _png(fig, dpi: int, transparent: bool = False) -> bytes:
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi, transparent=transparent)
+    return buf.getvalue()
+
+
+def _render_frame(kind: str, params: Dict[str, Any], dpi: int) -> Tuple[bytes, bytes, Dict[str, Any]]:
+    """Returns: (Hintergrund-PNG, Daten-PNG, Titel samt Lage in Bildanteilen)."""
+    _init_worker()
+    view = VIEWS[kind](params)
+    fig, ax = view.fig, view.ax
+    try:
+        fig.canvas.draw()
+        title = ax.title
+        box = title.get_window_extent().transformed(fig.transFigure.inverted())
+        caption = {
+            "text": _plain(title.get_text()),
+            "x": float(box.x0 + box.x1) / 2.0,
+            "top": 1.0 - float(box.y1),
+            "px": title.get_fontsize() * dpi / 72.0,
+        }
+
+        dynamic = {id(a) for a in view._dynamic}
+        for a in view._dynamic:
+            a.set_visible(False)
+        background = _png(fig, dpi)
+
+        for a in view._dynamic:
+            a.set_visible(a is not title)
+        for a in [fig.patch, *ax.get_children()]:
+            if id(a) not in dynamic:
+                a.set_visible(False)
+        data = _png(fig, dpi, transparent=True)
+    finally:
+        view.close()
+    return background, data, caption
+
+
+def build_bundle(
+    grids: Dict[str, Dict[str, List[Any]]],
+    workers: int | None = None,
+    dpi: int = DEFAULT_DPI,
+) -> Dict[str, Any]:
+    """
+    Zeichnet alle Kombinationen und packt sie zusammen.
+
+    Returns: {"views": {grafiktyp: {"names": [...], "values": [[...], ...],
+                                    "frames": [[hintergrund, daten, titel] oder None, ...]}},
+              "images": [base64-PNG, ...]}
+
+    hintergrund/daten sind Indizes in images; frames ist zeilenweise über
+    die (sortierten) Parameter angeordnet, wie expand_grid; None markiert
+    eine fehlgeschlagene Kombination.
+    """
+    views: Dict[str, Dict[str, Any]] = {}
+    jobs = []
+    for kind, grid in grids.items():
+        if kind not in VIEWS:
+            raise ValueError(f"Unbekannter Grafiktyp: {kind!r} (bekannt: {sorted(VIEWS)})")
+        names = sorted(grid)
+        combos = expand_grid(grid)
+        views[kind] = {"names": names, "values": [list(grid[k]) for k in names], "frames": [None] * len(combos)}
+        jobs.extend((kind, i, params) for i, params in enumerate(combos))
+
+    images: List[str] = []
+    index_of: Dict[str, int] = {}  # Inhalts-Hash -> Bild-Index
+
+    def add(png: bytes) -> int:
+        digest = hashlib.sha256(png).hexdigest()
+        if digest not in index_of:
+            index_of[digest] = len(images)
+            images.append(base64.b64encode(png).decode("ascii"))
+        return index_of[digest]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = {pool.submit(_render_frame, kind, params, dpi): (kind, i, params) for kind, i, params in jobs}
+        for fut in as_completed(futures):
+            kind, i, params = futures[fut]
+            try:
+                background, data, caption = fut.result()
+            except Exception as exc:  # eine fehlerhafte Kombination stoppt nicht den Export
+                print(f"FEHLER {kind} {params}: {exc!r}")
+                continue
+            views[kind]["frames"][i] = [add(background), add(data), caption]
+
+    return {"views": views, "images": images}
+
+
+# ============================================================
+# Statischer Betrachter
+# ============================================================
+
+_HTML = """<!DOCTYPE html>
+<html lang="de">
+<head>
+<meta charset="utf-8">
+<title>__TITLE__</title>
+<style>
+  body { font-family: sans-serif; margin: 1.5em; }
+  section { margin-bottom: 2.5em; }
+  label { display: block; margin: 0.3em 0; }
+  label span { display: inline-block; min-width: 6em; }
+  input[type=range] { width: 20em; vertical-align: middle; }
+  .frame { position: relative; display: inline-block; margin-top: 0.8em; }
+  .frame img { display: block; }
+  .frame img.data { position: absolute; left: 0; top: 0; }
+  .frame .caption { position: absolute; transform: translateX(-50%); text-align: center;
+                    white-space: pre; font-family: "DejaVu Sans", sans-serif; }
+</style>
+</head>
+<body>
+<h1>__TITLE__</h1>
+<div id="views"></div>
+<script id="bundle" type="application/json">__DATA__</script>
+<script>
+"use strict";
+const bundle = JSON.parse(document.getElementById("bundle").textContent);
+const root = document.getElementById("views");
+const src = (id) => "data:image/png;base64," + bundle.images[id];
+
+for (const [kind, view] of Object.entries(bundle.views)) {
+  const section = document.createElement("section");
+  section.innerHTML = "<h2>" + kind + "</h2>";
+  const idx = view.names.map(() => 0);
+  const frame = document.createElement("div");
+  frame.className = "frame";
+  const background = document.createElement("img");
+  const data = document.createElement("img");
+  data.className = "data";
+  const caption = document.createElement("div");
+  caption.className = "caption";
+  frame.append(background, data, caption);
+  const missing = document.createElement("p");
+  missing.textContent = "(kein Bild für diese Kombination)";
+
+  function show() {
+    let flat = 0;
+    for (let i = 0; i < idx.length; i++) flat = flat * view.values[i].length + idx[i];
+    const f = view.frames[flat];
+    frame.hidden = f === null;
+    missing.hidden = f !== null;
+    if (f === null) return;
+    const [bg, fg, title] = f;
+    background.src = src(bg);
+    data.src = src(fg);
+    caption.textContent = title.text;
+    caption.style.left = (100 * title.x) + "%";
+    caption.style.top = (100 * title.top) + "%";
+    caption.style.fontSize = title.px + "px";
+  }
+
+  view.names.forEach((name, i) => {
+    const label = document.createElement("label");
+    const text = document.createElement("span");
+    const value = document.createElement("output");
+    const slider = document.createElement("input");
+    slider.type = "range";
+    slider.min = 0;
+    slider.max = view.values[i].length - 1;
+    slider.value = 0;
+    text.textContent = name;
+    value.textContent = view.values[i][0];
+    slider.addEventListener("input", () => {
+      idx[i] = Number(slider.value);
+      value.textContent = view.values[i][idx[i]];
+      show();
+    });
+    label.append(text, slider, " ", value);
+    section.append(label);
+  });
+
+  section.append(frame, missing);
+  root.append(section);
+  show();
+}
+</script>
+</body>
+</html>
+"""
+
+
+def write_bundle(bundle: Dict[str, Any], outpath: Path, title: str = "Interaktive Demos") -> int:
+    """Schreibt den Betrachter samt Daten als eine HTML-Datei. Returns: Dateigröße in Bytes."""
+    # "</" im eingebetteten JSON würde das <script>-Element vorzeitig schließen
+    data = json.dumps(bundle, separators=(",", ":"), ensure_ascii=False, default=str).replace("</", "<\\/")
+    html = _HTML.replace("__TITLE__", title).replace("__DATA__", data)
+    outpath = Path(outpath)
+    outpath.parent.mkdir(parents=True, exist_ok=True)
+    outpath.write_text(html, encoding="utf-8")
+    return outpath.stat().st_size
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Interaktive Demos als statische HTML-Datei exportieren.")
+    parser.add_argument("grid", type=Path, help="JSON-Datei {grafiktyp: {parameter: [werte]}}")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI)
+    parser.add_argument("--title", default="Interaktive Demos")
+    args = parser.parse_args(argv)
+
+    grids = json.loads(args.grid.read_text(encoding="utf-8"))
+    bundle = build_bundle(grids, workers=args.workers, dpi=args.dpi)
+    size = write_bundle(bundle, args.out, title=args.title)
+    frames = sum(len(v["frames"]) for v in bundle["views"].values())
+    print(
+        f"{args.out}: {frames} Kombinationen, {len(bundle['images'])} verschiedene Ebenen "
+        f"(statt {2 * frames}), {size / 1e6:.2f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
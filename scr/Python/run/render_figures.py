@@ -0,0 +1,257 @@
+"""
+Stapel-Erzeugung der Grafiken in fig/ (headless, Agg, parallel).
+
+Pro Grafiktyp wird ein Parametergitter angegeben; jede Kombination ergibt
+eine Datei. Ein Schlüssel aus Parametern und Quelltext der beteiligten
+Module entscheidet, ob eine vorhandene Datei noch aktuell ist – nach einer
+kleinen Änderung wird nur neu gezeichnet, was davon betroffen ist.
+
+Aufruf (aus scr/Python):
+    python -m run.render_figures grid.json --out ../../fig --workers 8
+
+grid.json, z. B.:
+    {"ci_ellipse": {"n": [50, 80], "gamma": [0.9, 0.95], "h_obs": [0.63]}}
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from core.result_cache_core import code_version as _module_version
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_OUT = PROJECT_ROOT / "fig"
+MANIFEST = "manifest.json"
+SAVE_EVERY_S = 2.0  # Manifest spätestens alle ... Sekunden zwischenspeichern
+
+
+# ============================================================
+# Grafiktypen
+# ============================================================
+
+def _render_ci_ellipse(params: Dict[str, Any], outpath: Path) -> None:
+    from plot.ci_ellipse_plot import plot_ci_ellipse
+
+    plot_ci_ellipse(**params, show=False, outpath=outpath)
+
+
+def _render_wilson_intervals(params: Dict[str, Any], outpath: Path) -> None:
+    from core.wilson_core import simulate_wilson_intervals
+    from plot.wilson_plot import plot_intervals
+
+    n, p_true, gamma, m = params["n"], params["p_true"], params["gamma"], params["m"]
+    seed = params.get("seed", 7)
+    intervals, cover, rate = simulate_wilson_intervals(n=n, p_true=p_true, gamma=gamma, m=m, seed=seed)
+    title = (
+        f"{m} Intervalle (Wilson), n={n}, γ={gamma:.2f}\n"
+        f"Trefferquote ≈ {rate:.2f}  |  Seed {seed}"
+    )
+    plot_intervals(intervals=intervals, cover=cover, p_true=p_true, title=title, show=False, outpath=outpath)
+
+
+def _render_binom_test(params: Dict[str, Any], outpath: Path) -> None:
+    import matplotlib.pyplot as plt
+
+    from core.binom_test_core import BinomTestSpec
+    from plot.binom_test_plot import plot_simulation_vs_exact_region
+
+    spec = BinomTestSpec(n=params["n"], p0=params["p0"], alpha=params["alpha"], side=params.get("side", "right"))
+    fig, _, _, _ = plot_simulation_vs_exact_region(
+        spec, runs=params.get("runs", 1000), seed=params.get("seed", 42)
+    )
+    fig.savefig(outpath)
+    plt.close(fig)
+
+
+def _render_setzstrategien(params: Dict[str, Any], outpath: Path) -> None:
+    import random
+
+    from core.Setzstrategien_core import exact_probabilities_fraction, simulate_many
+    from plot.Setzstrategien_plot import plot_sim_vs_exact
+
+    p = [Fraction(x) for x in params["p"]]
+    A, B = params["A"], params["B"]
+    random.seed(params.get("seed", 0))
+
+    exact_floats = [float(v) for v in exact_probabilities_fraction(p, A, B)]
+    sim_by_runs = {
+        n_runs: simulate_many([float(x) for x in p], A, B, n_runs=n_runs)
+        for n_runs in params["n_runs_list"]
+    }
+    plot_sim_vs_exact(
+        sim_by_runs=sim_by_runs,
+        exact_floats=exact_floats,
+        labels=["A gewinnt", "B gewinnt", "Unentschieden"],
+        save_path=str(outpath),
+        show=False,
+    )
+
+
+# name -> (Zeichenfunktion, Module, deren Quelltext in den Schlüssel eingeht)
+FIGURES: Dict[str, Tuple[Callable[[Dict[str, Any], Path], None], Tuple[str, ...]]] = {
+    "ci_ellipse": (
+        _render_ci_ellipse,
+        ("core.ci_ellipse_core", "plot.ci_ellipse_plot", "plot.incremental"),
+    ),
+    "wilson_intervals": (
+        _render_wilson_intervals,
+        ("core.rng_core", "core.wilson_core", "plot.wilson_plot", "plot.incremental"),
+    ),
+    "binom_test": (
+        _render_binom_test,
+        ("core.rng_core", "core.binom_test_core", "plot.binom_test_plot", "plot.incremental"),
+    ),
+    "setzstrategien": (
+        _render_setzstrategien,
+        ("core.Setzstrategien_core", "plot.Setzstrategien_plot"),
+    ),
+}
+
+
+# ============================================================
+# Schlüssel / Manifest
+# ============================================================
+
+def _canonical(obj: Any) -> str:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def code_version(kind: str) -> str:
+    """Hash über den Quelltext aller Module, die den Grafiktyp erzeugen (samt diesem)."""
+    return _module_version("run.render_figures", *FIGURES[kind][1])
+
+
+def expand_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Kartesisches Produkt eines Parametergitters {name: [werte, ...]}."""
+    names = sorted(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[k] for k in names))]
+
+
+def _filename(kind: str, params: Dict[str, Any], fmt: str) -> str:
+    # Name hängt nur von den Parametern ab, nicht vom Code-Stand
+    digest = hashlib.sha256(_canonical([kind, params]).encode()).hexdigest()[:12]
+    return f"{kind}-{digest}.{fmt}"
+
+
+def _load_manifest(outdir: Path) -> Dict[str, Dict[str, Any]]:
+    path = outdir / MANIFEST
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _save_manifest(outdir: Path, manifest: Dict[str, Dict[str, Any]]) -> None:
+    tmp = outdir / (MANIFEST + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True, default=str), encoding="utf-8")
+    os.replace(tmp, outdir / MANIFEST)
+
+
+# ============================================================
+# Rendern
+# ============================================================
+
+def _init_worker() -> None:
+    import matplotlib
+
+    matplotlib.use("Agg", force=True)
+
+
+def _render_job(kind: str, params: Dict[str, Any], outpath: str) -> str:
+    _init_worker()
+    FIGURES[kind][0](params, Path(outpath))
+    return outpath
+
+
+def render_figures(
+    grids: Dict[str, Dict[str, List[Any]]],
+    outdir: Path = DEFAULT_OUT,
+    fmt: str = "pdf",
+    workers: int | None = None,
+    force: bool = False,
+) -> Dict[str, List[str]]:
+    """
+    Erzeugt alle Grafiken der Parametergitter in outdir.
+
+    grids:   {grafiktyp: {parameter: [werte, ...]}}
+    force:   auch aktuelle Dateien neu zeichnen
+    workers: Anzahl Prozesse (None = os.cpu_count())
+
+    Returns: {"rendered": [...], "skipped": [...], "failed": [...]} (Dateinamen)
+    """
+    outdir = Path(outdir)
+    outdir.mkdir(parents=True, exist_ok=True)
+    manifest = _load_manifest(outdir)
+
+    jobs = []
+    skipped: List[str] = []
+    for kind, grid in grids.items():
+        if kind not in FIGURES:
+            raise ValueError(f"Unbekannter Grafiktyp: {kind!r} (bekannt: {sorted(FIGURES)})")
+        version = code_version(kind)
+        for params in expand_grid(grid):
+            name = _filename(kind, params, fmt)
+            key = hashlib.sha256(_canonical([kind, params, version]).encode()).hexdigest()
+            entry = manifest.get(name)
+            if not force and entry is not None and entry["key"] == key and (outdir / name).exists():
+                skipped.append(name)
+                continue
+            jobs.append((kind, params, name, key))
+
+    rendered: List[str] = []
+    failed: List[str] = []
+    if jobs:
+        last_save = time.monotonic()
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                futures = {
+                    pool.submit(_render_job, kind, params, str(outdir / name)): (kind, params, name, key)
+                    for kind, params, name, key in jobs
+                }
+                for fut in as_completed(futures):
+                    kind, params, name, key = futures[fut]
+                    try:
+                        fut.result()
+                    except Exception as exc:  # eine fehlerhafte Grafik stoppt nicht den Stapel
+                        print(f"FEHLER {name}: {exc!r}")
+                        manifest.pop(name, None)
+                        failed.append(name)
+                        continue
+                    manifest[name] = {"kind": kind, "params": params, "key": key}
+                    rendered.append(name)
+                    # laufend sichern: nach einem Abbruch bleibt Fertiges übersprungen
+                    if time.monotonic() - last_save >= SAVE_EVERY_S:
+                        _save_manifest(outdir, manifest)
+                        last_save = time.monotonic()
+        finally:
+            _save_manifest(outdir, manifest)
+
+    return {"rendered": sorted(rendered), "skipped": sorted(skipped), "failed": sorted(failed)}
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Grafiken aus Parametergittern erzeugen.")
+    parser.add_argument("grid", type=Path, help="JSON-Datei {grafiktyp: {parameter: [werte]}}")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    parser.add_argument("--format", default="pdf")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args(argv)
+
+    grids = json.loads(args.grid.read_text(encoding="utf-8"))
+    result = render_figures(grids, outdir=args.out, fmt=args.format, workers=args.workers, force=args.force)
+    print(
+        f"neu: {len(result['rendered'])}, aktuell: {len(result['skipped'])}, "
+        f"Fehler: {len(result['failed'])}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+Parameter-Sweeps als Kommandozeilen-Lauf (parallel, fortsetzbar).
+
+Eine Sweep-Datei (JSON) beschreibt einen oder mehrere Sweeps:
+
+    [
+      {"kind": "wilson_coverage",
+       "grid": {"n": [20, 50, 100], "p_true": [0.1, 0.5], "gamma": [0.95],
+                "m": [100000], "seed": [1]},
+       "output": "coverage.csv"},
+      {"kind": "binom_test",
+       "grid": {"n": [50, 100], "p0": [0.5], "alpha": [0.05],
+                "side": ["left", "right", "two"], "runs": [100000]},
+       "output": "binom.parquet"}
+    ]
+
+Jede Kombination ist ein Job; die Jobs laufen in einem Prozess-Pool, die
+Ergebnisse werden blockweise an die Ausgabe angehängt (CSV oder Parquet
+via pandas). Bricht ein Lauf ab, überspringt der nächste Aufruf alle Jobs,
+deren job_id schon in der Ausgabe steht.
+
+Aufruf (aus scr/Python):
+    python -m run.sweep sweeps.json --workers 8
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Set
+
+from run.render_figures import expand_grid
+
+
+# ============================================================
+# Job-Arten
+# ============================================================
+
+def _job_chip_game(params: Dict[str, Any]) -> Dict[str, Any]:
+    from core.Setzstrategien_core import simulate_many
+
+    p = [Fraction(x) for x in params["p"]]
+    A, B = params["A"], params["B"]
+    sim = simulate_many(
+        [float(x) for x in p], A, B,
+        n_runs=params.get("n_runs", 10_000),
+        z=params.get("z", 1.96),
+        seed=params.get("seed", 0),
+    )
+    row: Dict[str, Any] = {}
+    for key in ("A", "B", "U"):
+        for name, value in sim[key].items():
+            row[f"{name}_{key}"] = value
+    exact = [None, None, None]
+    if params.get("exact", False):
+        from core.result_cache_core import exact_probabilities_cached
+
+        exact = [float(value) for value in exact_probabilities_cached(p, A, B)]
+    for key, value in zip(("A", "B", "U"), exact):
+        row[f"exact_{key}"] = value
+    return row
+
+
+def _job_binom_test(params: Dict[str, Any]) -> Dict[str, Any]:
+    from core.binom_test_core import BinomTestSpec, alpha_hat_from_region, critical_region, simulate_binom
+
+    spec = BinomTestSpec(n=params["n"], p0=params["p0"], alpha=params["alpha"], side=params.get("side", "right"))
+    region = critical_region(spec)
+    X = simulate_binom(spec.n, spec.p0, runs=params.get("runs", 10_000), seed=params.get("seed", 42))
+    return {
+        "k_left": region.k_left,
+        "k_right": region.k_right,
+        "alpha_hat": alpha_hat_from_region(X, region, spec.side),
+    }
+
+
+def _job_wilson_coverage(params: Dict[str, Any]) -> Dict[str, Any]:
+    from core.wilson_core import simulate_wilson_intervals, wilson_coverage, z_value
+
+    n, p_true, gamma = params["n"], params["p_true"], params["gamma"]
+    intervals, _, rate = simulate_wilson_intervals(n, p_true, gamma, params.get("m", 10_000), seed=params.get("seed", 1))
+    return {
+        "coverage_hat": rate,
+        "coverage_exact": float(wilson_coverage(n, p_true, z_value(gamma))),
+        "mean_width": float((intervals[:, 1] - intervals[:, 0]).mean()),
+    }
+
+
+JOBS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "chip_game": _job_chip_game,
+    "binom_test": _job_binom_test,
+    "wilson_coverage": _job_wilson_coverage,
+}
+
+
+# Ergebnisspalten je Job-Art, in fester Reihenfolge: jeder Block wird darauf
+# ausgerichtet, damit CSV-Kopf und Parquet-Schema für alle Blöcke gleich sind
+RESULT_COLUMNS: Dict[str, List[str]] = {
+    "chip_game": [
+        f"{name}_{key}" for key in ("A", "B", "U") for name in ("p_hat", "CI_low", "CI_high")
+    ] + ["exact_A", "exact_B", "exact_U"],
+    "binom_test": ["k_left", "k_right", "alpha_hat"],
+    "wilson_coverage": ["coverage_hat", "coverage_exact", "mean_width"],
+}
+
+# Spalten, die in einzelnen Blöcken nur None enthalten können: mit festem
+# (nullbarem) Typ, sonst legt Parquet sie blockweise als "null" an und die
+# Teildateien lassen sich nicht mehr gemeinsam lesen
+COLUMN_DTYPES: Dict[str, Dict[str, str]] = {
+    "chip_game": {"seed": "Int64", "exact_A": "Float64", "exact_B": "Float64", "exact_U": "Float64"},
+    "binom_test": {"k_left": "Int64", "k_right": "Int64", "seed": "Int64"},
+    "wilson_coverage": {"seed": "Int64"},
+}
+
+
+def output_columns(kind: str, grid: Dict[str, List[Any]]) -> List[str]:
+    """Spalten der Ausgabe eines Sweeps (wie _run_job sie füllt)."""
+    return ["job_id", "kind", *sorted(grid), *RESULT_COLUMNS[kind], "elapsed_s"]
+
+
+def job_id(kind: str, params: Dict[str, Any]) -> str:
+    canonical = json.dumps([kind, params], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def _run_job(kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    result = JOBS[kind](params)
+    row: Dict[str, Any] = {"job_id": job_id(kind, params), "kind": kind}
+    for name, value in params.items():
+        # Listen (z. B. Spielbrett) als JSON-Text, damit die Spalten skalar bleiben
+        row[name] = json.dumps(value) if isinstance(value, (list, dict)) else value
+    row.update(result)
+    row["elapsed_s"] = time.perf_counter() - t0
+    return row
+
+
+# ============================================================
+# Ausgabe (CSV / Parquet), blockweise angehängt
+# ============================================================
+
+def _is_parquet(path: Path) -> bool:
+    return path.suffix == ".parquet"
+
+
+def _done_ids(path: Path) -> Set[str]:
+    """job_ids, die in der Ausgabe bereits stehen."""
+    import pandas as pd
+
+    if _is_parquet(path):
+        parts = sorted(path.glob("part-*.parquet")) if path.is_dir() else []
+        return {jid for part in parts for jid in pd.read_parquet(part, columns=["job_id"])["job_id"]}
+    if not path.exists() or path.stat().st_size == 0:
+        return set()
+    return set(pd.read_csv(path, usecols=["job_id"], dtype=str)["job_id"])
+
+
+def _reset(path: Path) -> None:
+    """Vorhandene Ausgabe verwerfen (Lauf ohne Fortsetzen)."""
+    if _is_parquet(path) and path.is_dir():
+        for part in path.glob("part-*.parquet"):
+            part.unlink()
+    elif path.exists():
+        path.unlink()
+
+
+def _append(
+    path: Path,
+    rows: List[Dict[str, Any]],
+    columns: List[str],
+    dtypes: Dict[str, str] | None = None,
+) -> None:
+    import pandas as pd
+
+    if not rows:
+        return
+    # feste Spalten statt der zufällig im Block vorhandenen
+    df = pd.DataFrame(rows).reindex(columns=columns)
+    if dtypes:
+        df = df.astype({name: dtype for name, dtype in dtypes.items() if name in df.columns})
+    if _is_parquet(path):
+        # Parquet kennt kein Anhängen: ein Verzeichnis mit einer Datei je Block
+        path.mkdir(parents=True, exist_ok=True)
+        index = len(list(path.glob("part-*.parquet")))
+        tmp = path / f".part-{index:05d}.tmp"
+        df.to_parquet(tmp, index=False)
+        tmp.rename(path / f"part-{index:05d}.parquet")
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    header = not path.exists() or path.stat().st_size == 0
+    df.to_csv(path, mode="a", header=header, index=False)
+
+
+def run_sweep(
+    kind: str,
+    grid: Dict[str, List[Any]],
+    output: Path,
+    workers: int | None = None,
+    flush_every: int = 50,
+    resume: bool = True,
+) -> Dict[str, int]:
+    """
+    Führt alle Jobs eines Gitters aus und hängt die Ergebnisse an output an.
+    resume=False verwirft eine vorhandene Ausgabe und rechnet alles neu.
+    Returns: {"done": ..., "skipped": ..., "failed": ...}
+    """
+    if kind not in JOBS:
+        raise ValueError(f"Unbekannte Sweep-Art: {kind!r} (bekannt: {sorted(JOBS)})")
+    output = Path(output)
+
+    jobs = expand_grid(grid)
+    if not resume:
+        _reset(output)
+    done = _done_ids(output) if resume else set()
+    columns = output_columns(kind, grid)
+    dtypes = COLUMN_DTYPES.get(kind)
+    todo = [params for params in jobs if job_id(kind, params) not in done]
+    skipped = len(jobs) - len(todo)
+
+    buffer: List[Dict[str, Any]] = []
+    finished = failed = 0
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_run_job, kind, params): params for params in todo}
+            for fut in as_completed(futures):
+                try:
+                    buffer.append(fut.result())
+                    finished += 1
+                except Exception as exc:  # ein fehlerhafter Job stoppt nicht den Sweep
+                    print(f"FEHLER {kind} {futures[fut]}: {exc!r}")
+                    failed += 1
+                if len(buffer) >= flush_every:
+                    _append(output, buffer, columns, dtypes)
+                    buffer = []
+                    print(f"{kind}: {finished + skipped}/{len(jobs)}")
+        _append(output, buffer, columns, dtypes)
+
+    return {"done": finished, "skipped": skipped, "failed": failed}
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Parameter-Sweeps parallel ausführen.")
+    parser.add_argument("spec", type=Path, help="JSON-Datei mit einem Sweep oder einer Liste von Sweeps")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--flush-every", type=int, default=50, help="Zeilen pro Schreibblock")
+    parser.add_argument("--no-resume", action="store_true", help="vorhandene Ergebnisse verwerfen und alles neu rechnen")
+    args = parser.parse_args(argv)
+
+    specs = json.loads(args.spec.read_text(encoding="utf-8"))
+    if isinstance(specs, dict):
+        specs = [specs]
+
+    any_failed = False
+    for spec in specs:
+        output = Path(spec["output"])
+        if not output.is_absolute():
+            output = args.spec.parent / output
+        result = run_sweep(
+            spec["kind"], spec["grid"], output,
+            workers=args.workers, flush_every=args.flush_every, resume=not args.no_resume,
+        )
+        print(f"{spec['kind']} -> {output}: {result}")
+        any_failed |= result["failed"] > 0
+    return 1 if any_failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
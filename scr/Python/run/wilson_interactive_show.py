@@ -2,38 +2,92 @@ from core.wilson_core import simulate_wilson_intervals
 from plot.wilson_plot import plot_intervals
 
 
-# ============================================================
-# Parameter (hier dürfen SuS/LuL experimentieren)
-# ============================================================
-n = 80
-p_true = 0.60
-gamma = 0.95
-m = 100
-
-seed = 7   # Empfehlung: feste Zahl für reproduzierbare Diskussion
-# seed = None  # bewusst: jedes Mal neue Simulation
-
-
-intervals, cover, rate = simulate_wilson_intervals(
-    n=n,
-    p_true=p_true,
-    gamma=gamma,
-    m=m,
-    seed=seed
-)
-
-title = (
-    f"{m} Intervalle (Wilson), n={n}, γ={gamma:.2f}\n"
-    f"Trefferquote ≈ {rate:.2f}  |  Seed {seed}"
-)
-
-plot_intervals(
-    intervals=intervals,
-    cover=cover,
-    p_true=p_true,
-    title=title,
-    show=True,
-    outpath=None
-)
-
-print("Trefferquote:", round(rate, 3))
+def interactive_wilson(
+    n: int = 80,
+    p_true: float = 0.60,
+    gamma: float = 0.95,
+    m: int = 100,
+    seed: int | None = 7,
+    prefetch: bool = True,
+):
+    """
+    Slider-Variante für das Notebook: die Figur wird einmal aufgebaut, jede
+    Slider-Bewegung simuliert neu und ruft nur IntervalsView.update(...) auf.
+    Simulationen benachbarter Sliderwerte werden mit prefetch=True im
+    Hintergrund vorausberechnet (nur mit festem seed).
+
+    Im Notebook vorher `%matplotlib widget` (ipympl), damit die Figur an Ort
+    und Stelle aktualisiert wird.
+
+    Returns: (view, controls)
+    """
+    import ipywidgets as widgets
+    import matplotlib.pyplot as plt
+    from IPython.display import display
+
+    from core.prefetch_core import wilson_prefetcher
+    from plot.wilson_plot import IntervalsView
+
+    simulate = wilson_prefetcher().get if prefetch else simulate_wilson_intervals
+
+    def data(n, p_true, gamma, m):
+        intervals, cover, rate = simulate(n=n, p_true=p_true, gamma=gamma, m=m, seed=seed)
+        title = (
+            f"{m} Intervalle (Wilson), n={n}, γ={gamma:.2f}\n"
+            f"Trefferquote ≈ {rate:.2f}  |  Seed {seed}"
+        )
+        return intervals, cover, p_true, title
+
+    view = IntervalsView(*data(n, p_true, gamma, m))
+
+    def on_change(n, p_true, gamma, m):
+        view.update(*data(n, p_true, gamma, m))
+
+    controls = widgets.interactive(
+        on_change,
+        n=widgets.IntSlider(value=n, min=5, max=max(500, n)),
+        p_true=widgets.FloatSlider(value=p_true, min=0.01, max=0.99, step=0.01),
+        gamma=widgets.FloatSlider(value=gamma, min=0.5, max=0.99, step=0.01),
+        m=widgets.IntSlider(value=m, min=10, max=max(1000, m), step=10),
+    )
+    display(controls)
+    plt.show()
+    return view, controls
+
+
+if __name__ == "__main__":
+    # ============================================================
+    # Parameter (hier dürfen SuS/LuL experimentieren)
+    # ============================================================
+    n = 80
+    p_true = 0.60
+    gamma = 0.95
+    m = 100
+
+    seed = 7   # Empfehlung: feste Zahl für reproduzierbare Diskussion
+    # seed = None  # bewusst: jedes Mal neue Simulation
+
+
+    intervals, cover, rate = simulate_wilson_intervals(
+        n=n,
+        p_true=p_true,
+        gamma=gamma,
+        m=m,
+        seed=seed
+    )
+
+    title = (
+        f"{m} Intervalle (Wilson), n={n}, γ={gamma:.2f}\n"
+        f"Trefferquote ≈ {rate:.2f}  |  Seed {seed}"
+    )
+
+    plot_intervals(
+        intervals=intervals,
+        cover=cover,
+        p_true=p_true,
+        title=title,
+        show=True,
+        outpath=None
+    )
+
+    print("Trefferquote:", round(rate, 3))